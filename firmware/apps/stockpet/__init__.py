@@ -13,6 +13,8 @@ import wifi
 import secrets
 import json
 import math
+import micropython
+from array import array
 
 os.chdir(APP_DIR)
 sys.path.insert(0, APP_DIR)
@@ -51,11 +53,19 @@ except AttributeError:
 EST_OFFSET = LOCAL_TZ - (-5)
 
 LERP_SPEED = 0.003          # smooth width transition per ms
+_LERP_SPEED_FX = int(LERP_SPEED * 65536)  # same rate in Q16.16 per ms
 BLINK_MIN_MS = 2500          # min time between blinks
 BLINK_MAX_MS = 6000          # max time between blinks
 BLINK_DURATION_MS = 150      # how long eyes stay closed
 STAR_COUNT = 12
 CONFETTI_COUNT = 10
+SIM_STEP_MS = 33             # fixed confetti physics step
+FRAME_BUDGET_MS = 33
+# Cadence for the second-scale housekeeping in update(): wifi state,
+# battery reads, auto dim/cycle, refresh checks. Input pulls it forward.
+HOUSEKEEP_MS = 250
+# Battery level moves at minute scale; don't hit the ADC more than this
+BATTERY_POLL_MS = 5000         # skip decorative draws when avg render exceeds this
 
 COLORS = {
     "bg":           (0, 0, 0),
@@ -104,6 +114,11 @@ except AttributeError:
     FINNHUB_KEY = None
     print("[stockpet] WARNING: No FINNHUB_KEY, using mock data")
 
+# Request paths never change after startup, so build them once here
+# rather than re-formatting an f-string on every fetch
+_QUOTE_PATHS = {t: f"/api/v1/quote?symbol={t}&token={FINNHUB_KEY}" for t in STOCKS}
+_MARKET_STATUS_PATH = f"/api/v1/stock/market-status?exchange=US&token={FINNHUB_KEY}"
+
 
 # =============================================================================
 # Load Moods
@@ -139,11 +154,7 @@ MOCK_DATA = {
 
 def get_mock_data(ticker):
     base = MOCK_DATA.get(ticker, MOCK_DATA["TSLA"])
-    return {
-        "price": base["price"], "change": base["change"],
-        "change_percent": base["change_percent"],
-        "last_fetch_ms": time.ticks_ms(), "error": False,
-    }
+    return (base["price"], base["change"], base["change_percent"])
 
 
 class AppMode:
@@ -152,30 +163,51 @@ class AppMode:
     INFO = 2
 
 
+class Settings:
+    """User-tweakable options as slotted attributes.
+
+    These are read in the per-frame housekeeping paths; a slotted
+    attribute load is several times cheaper than dict.get on MicroPython.
+    """
+
+    __slots__ = ("show_battery", "case_light", "auto_dim", "auto_cycle")
+
+    def __init__(self):
+        self.show_battery = True
+        self.case_light = True
+        self.auto_dim = 0
+        self.auto_cycle = False
+
+    def snapshot(self):
+        """Hashable state tuple for the render-skip cache keys."""
+        return (self.show_battery, self.case_light, self.auto_dim, self.auto_cycle)
+
+
 # =============================================================================
 # Formatting
 # =============================================================================
 
-def _fmt_decimal(val, decimals=2):
-    rounded = round(val, decimals)
-    s = str(rounded)
-    if "." not in s:
-        return s + "." + "0" * decimals
-    integer, frac = s.split(".")
-    while len(frac) < decimals:
-        frac += "0"
-    return integer + "." + frac
+def _fmt2(val):
+    """val to 2 decimal places via integer math - no round()/str-split churn."""
+    n = int(val * 100 + (0.5 if val >= 0 else -0.5))
+    sign = "" if n >= 0 else "-"
+    if n < 0:
+        n = -n
+    return sign + str(n // 100) + "." + ("0" + str(n % 100))[-2:]
 
 def fmt_price(val):
-    return "$" + _fmt_decimal(val, 2)
+    return "$" + _fmt2(val)
 
 def fmt_change(val):
     prefix = "+" if val >= 0 else ""
-    return prefix + _fmt_decimal(val, 2)
+    return prefix + _fmt2(val)
 
 def fmt_percent(val):
     return fmt_change(val) + "%"
 
+def fmt_nav(index):
+    return f"< {index + 1}/{len(STOCKS)} >"
+
 def fmt_time_ago(ms_ago):
     if ms_ago < 0:
         return "Never"
@@ -191,7 +223,13 @@ def fmt_time_ago(ms_ago):
 # Market Status
 # =============================================================================
 
-_market_cache = {"is_open": None, "session": None, "holiday": None, "last_fetch": 0}
+# Cached market status as flat module globals rather than a dict - this is
+# read every frame in the worst case, and plain global loads/stores beat
+# dict hashing (and .update() allocating a throwaway dict per write)
+_mc_is_open = None
+_mc_session = None
+_mc_holiday = None
+_mc_last_fetch = 0
 MARKET_CACHE_MS = 60_000
 
 def is_market_open_fallback():
@@ -216,26 +254,28 @@ def is_market_open_fallback():
     except Exception:
         return True, None, None
 
-def fetch_market_status():
-    global _market_cache
-    now = time.ticks_ms()
-    if _market_cache["is_open"] is not None and time.ticks_diff(now, _market_cache["last_fetch"]) < MARKET_CACHE_MS:
-        return _market_cache["is_open"], _market_cache["session"], _market_cache["holiday"]
+def fetch_market_status(now=None):
+    global _mc_is_open, _mc_session, _mc_holiday, _mc_last_fetch
+    if now is None:
+        now = time.ticks_ms()
+    if _mc_is_open is not None and time.ticks_diff(now, _mc_last_fetch) < MARKET_CACHE_MS:
+        return _mc_is_open, _mc_session, _mc_holiday
     if FINNHUB_KEY is None:
         return is_market_open_fallback()
     try:
-        import urequests
-        url = f"https://finnhub.io/api/v1/stock/market-status?exchange=US&token={FINNHUB_KEY}"
-        resp = urequests.get(url, timeout=5)
-        if resp.status_code != 200:
-            resp.close()
+        status, body = session_get(_MARKET_STATUS_PATH)
+        if status != 200:
             return is_market_open_fallback()
-        data = json.loads(resp.text)
-        resp.close()
-        is_open = data.get("isOpen", False)
-        session = data.get("session")
-        holiday = data.get("holiday")
-        _market_cache.update({"is_open": is_open, "session": session, "holiday": holiday, "last_fetch": now})
+        if b'"isOpen":' in body:
+            is_open = b'"isOpen":true' in body
+            session = _extract_string(body, b'"session":')
+            holiday = _extract_string(body, b'"holiday":')
+        else:
+            data = json.loads(body)
+            is_open = data.get("isOpen", False)
+            session = data.get("session")
+            holiday = data.get("holiday")
+        _mc_is_open, _mc_session, _mc_holiday, _mc_last_fetch = is_open, session, holiday, now
         print(f"[stockpet] Market: open={is_open}, session={session}, holiday={holiday}")
         return is_open, session, holiday
     except Exception as e:
@@ -247,48 +287,277 @@ def fetch_market_status():
 # Data Fetching
 # =============================================================================
 
+API_HOST = "finnhub.io"
+
+
+class FinnhubSession:
+    """One keep-alive TLS connection to finnhub.io, shared by all fetches.
+
+    Opening a fresh TCP + TLS connection per request costs a handshake
+    (easily 500ms+ on the Tufty's WiFi stack); reusing one socket pays
+    that cost once. A lock serialises requests from the fetch threads.
+    """
+
+    def __init__(self, host):
+        self.host = host
+        self.sock = None
+        try:
+            import _thread
+            self.lock = _thread.allocate_lock()
+        except ImportError:
+            self.lock = None
+
+    def _connect(self):
+        import socket
+        import ssl
+        addr = socket.getaddrinfo(self.host, 443)[0][-1]
+        sock = socket.socket()
+        sock.settimeout(10)
+        sock.connect(addr)
+        self.sock = ssl.wrap_socket(sock, server_hostname=self.host)
+
+    def _send(self, path):
+        self.sock.write(
+            "GET {} HTTP/1.1\r\nHost: {}\r\nConnection: keep-alive\r\n\r\n"
+            .format(path, self.host).encode())
+
+    def _read_response(self):
+        line = self.sock.readline()
+        if not line:
+            # The server dropped the idle keep-alive connection; surface it
+            # as OSError so the reconnect paths in get()/get_many() retry
+            # on a fresh socket instead of an IndexError escaping here.
+            raise OSError("connection closed")
+        status = int(line.split(b" ")[1])
+        content_length = 0
+        while True:
+            line = self.sock.readline()
+            if not line or line == b"\r\n":
+                break
+            if line.lower().startswith(b"content-length:"):
+                content_length = int(line.split(b":")[1])
+        body = self.sock.read(content_length) if content_length else b""
+        return status, body
+
+    def _request(self, path):
+        if self.sock is None:
+            self._connect()
+        self._send(path)
+        return self._read_response()
+
+    def get_many(self, paths):
+        """Pipeline several GETs: write every request before reading any.
+
+        HTTP/1.1 keep-alive returns responses in request order, so a batch
+        of N quotes costs roughly one round trip instead of N. If the
+        pipelined pass dies mid-stream the connection is torn down and the
+        batch is retried one request at a time.
+        """
+        if self.lock:
+            self.lock.acquire()
+        try:
+            try:
+                if self.sock is None:
+                    self._connect()
+                for path in paths:
+                    self._send(path)
+                return [self._read_response() for _ in paths]
+            except OSError:
+                self.close()
+                results = []
+                for path in paths:
+                    try:
+                        results.append(self._request(path))
+                    except OSError:
+                        self.close()
+                        results.append((0, b""))
+                return results
+        finally:
+            if self.lock:
+                self.lock.release()
+
+    def get(self, path):
+        """GET path, reconnecting once if the server dropped the connection."""
+        if self.lock:
+            self.lock.acquire()
+        try:
+            try:
+                return self._request(path)
+            except OSError:
+                self.close()
+                return self._request(path)
+        finally:
+            if self.lock:
+                self.lock.release()
+
+    def close(self):
+        if self.sock:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+
+
+_session = None
+
+
+def session_get(path):
+    global _session
+    if _session is None:
+        _session = FinnhubSession(API_HOST)
+    return _session.get(path)
+
+
+def _extract_number(body, key):
+    """Pull one numeric field out of a JSON byte payload without json.loads.
+
+    Scans for key (e.g. b'\"dp\":') and floats the sign/digit/dot/exponent
+    run that follows. Returns None when the key is missing or its value is
+    not numeric (e.g. null) - callers fall back to the full parser then.
+    Skipping json.loads avoids decoding the body to str and building a
+    dict we would only read three fields from.
+    """
+    idx = body.find(key)
+    if idx < 0:
+        return None
+    idx += len(key)
+    end = idx
+    n = len(body)
+    while end < n and body[end] in b"+-0123456789.eE":
+        end += 1
+    if end == idx:
+        return None
+    return float(body[idx:end])
+
+
+def _extract_string(body, key):
+    """Like _extract_number but for a quoted-string (or null) field."""
+    idx = body.find(key)
+    if idx < 0:
+        return None
+    idx += len(key)
+    if body[idx:idx + 1] != b'"':
+        return None
+    end = body.find(b'"', idx + 1)
+    if end < 0:
+        return None
+    return str(body[idx + 1:end], "utf-8")
+
+
+def _parse_quote(ticker, status, body):
+    """Decode one quote response body into (price, change, pct) or None."""
+    try:
+        if status != 200:
+            print(f"[stockpet] HTTP {status} for {ticker}")
+            return None
+        price = _extract_number(body, b'"c":')
+        if price is None:
+            # Unexpected payload shape - let the real parser have a go
+            data = json.loads(body)
+            price = data.get("c", 0)
+            change = data.get("d", 0) or 0
+            pct = data.get("dp", 0) or 0
+        else:
+            change = _extract_number(body, b'"d":') or 0
+            pct = _extract_number(body, b'"dp":') or 0
+        if price == 0:
+            print(f"[stockpet] No price data for {ticker}")
+            return None
+        print(f"[stockpet] {ticker}: ${price} ({fmt_percent(pct)})")
+        return (price, change, pct)
+    except Exception as e:
+        print(f"[stockpet] Parse error for {ticker}: {e}")
+        return None
+
 def fetch_stock_data(ticker):
+    """Fetch one quote; returns a (price, change, change_percent) tuple or None."""
     if FINNHUB_KEY is None:
         print(f"[stockpet] Mock data for {ticker}")
         return get_mock_data(ticker)
     try:
-        import urequests
-        url = f"https://finnhub.io/api/v1/quote?symbol={ticker}&token={FINNHUB_KEY}"
         print(f"[stockpet] Fetching {ticker}...")
-        resp = urequests.get(url, timeout=10)
-        if resp.status_code != 200:
-            print(f"[stockpet] HTTP {resp.status_code} for {ticker}")
-            resp.close()
-            return None
-        data = json.loads(resp.text)
-        resp.close()
-        if data.get("c", 0) == 0:
-            print(f"[stockpet] No price data for {ticker}")
-            return None
-        result = {
-            "price": data["c"],
-            "change": data.get("d", 0) or 0,
-            "change_percent": data.get("dp", 0) or 0,
-            "last_fetch_ms": time.ticks_ms(),
-            "error": False,
-        }
-        print(f"[stockpet] {ticker}: ${result['price']} ({fmt_percent(result['change_percent'])})")
-        return result
+        status, body = session_get(_QUOTE_PATHS[ticker])
     except Exception as e:
         print(f"[stockpet] Fetch error for {ticker}: {e}")
         return None
+    return _parse_quote(ticker, status, body)
 
-def get_data_age(stock_data):
-    if stock_data is None:
-        return 999999999
-    return time.ticks_diff(time.ticks_ms(), stock_data.get("last_fetch_ms", 0))
+def fetch_all_stocks(tickers):
+    """Fetch several tickers as one pipelined batch on the shared session.
 
-def is_data_fresh(stock_data, market_open):
-    return get_data_age(stock_data) < FRESH_MS
+    All requests go out back-to-back before the first response is read,
+    so the batch costs roughly one round trip plus transfer instead of a
+    round trip per ticker. Returns {ticker: result-or-None}.
+    """
+    if FINNHUB_KEY is None:
+        return {t: get_mock_data(t) for t in tickers}
+    global _session
+    if _session is None:
+        _session = FinnhubSession(API_HOST)
+    try:
+        responses = _session.get_many([_QUOTE_PATHS[t] for t in tickers])
+    except OSError as e:
+        print(f"[stockpet] Batch fetch error: {e}")
+        return dict.fromkeys(tickers)
+    results = {}
+    for k, t in enumerate(tickers):
+        status, body = responses[k]
+        results[t] = _parse_quote(t, status, body)
+    return results
+
+
+class StockStore:
+    """Struct-of-arrays quote cache, one slot per STOCKS index.
+
+    Parallel arrays replace the old dict-per-ticker layout, so the per-tick
+    mood/refresh path reads plain array slots instead of hashing dict keys.
+    Slots start seeded with mock data but last_fetch 0, i.e. never fetched.
+    """
 
-def is_data_stale(stock_data, market_open):
-    threshold = STALE_MS if market_open else MARKET_CLOSED_STALE_MS
-    return get_data_age(stock_data) > threshold
+    def __init__(self, tickers):
+        n = len(tickers)
+        self.n = n
+        self.prices = array("f", (0 for _ in range(n)))
+        self.changes = array("f", (0 for _ in range(n)))
+        self.pcts = array("f", (0 for _ in range(n)))
+        self.last_fetch = array("l", (0 for _ in range(n)))
+        self.errors = bytearray(n)
+        # Newest fetch stamp, maintained on write so the settings screen
+        # doesn't rescan last_fetch every frame
+        self.latest_fetch = 0
+        # Freshness deadlines precomputed at fetch time: the per-tick
+        # checks reduce to one ticks_diff against a stored deadline
+        # (zero-initialised slots read as never-fetched, i.e. stale)
+        self.fresh_until = array("l", (0 for _ in range(n)))
+        self.stale_open = array("l", (0 for _ in range(n)))
+        self.stale_closed = array("l", (0 for _ in range(n)))
+        for i in range(n):
+            price, change, pct = get_mock_data(tickers[i])
+            self.prices[i] = price
+            self.changes[i] = change
+            self.pcts[i] = pct
+
+    def set_quote(self, idx, quote):
+        self.prices[idx], self.changes[idx], self.pcts[idx] = quote
+        stamp = time.ticks_ms()
+        self.last_fetch[idx] = stamp
+        self.latest_fetch = stamp
+        self.fresh_until[idx] = stamp + FRESH_MS
+        self.stale_open[idx] = stamp + STALE_MS
+        self.stale_closed[idx] = stamp + MARKET_CLOSED_STALE_MS
+        self.errors[idx] = 0
+
+    def set_error(self, idx):
+        self.errors[idx] = 1
+
+
+def is_data_fresh(store, idx, now):
+    return time.ticks_diff(now, store.fresh_until[idx]) < 0
+
+def is_data_stale(store, idx, market_open, now):
+    deadline = store.stale_open[idx] if market_open else store.stale_closed[idx]
+    return time.ticks_diff(now, deadline) > 0
 
 
 # =============================================================================
@@ -333,12 +602,21 @@ def pick_mood_text(mood_key, index):
 def clamp(val, lo, hi):
     return max(lo, min(hi, val))
 
-def lerp(current, target, speed, dt):
+@micropython.native
+def lerp_fx(current, target, speed_fx, dt):
+    """Fixed-point (Q16.16) lerp: step current toward target by speed_fx*dt.
+
+    Sign handling uses an arithmetic-shift mask rather than abs()/compares,
+    keeping the per-frame animation path in straight-line integer math.
+    """
     diff = target - current
-    step = speed * dt
-    if abs(diff) < step:
-        return target
-    return current + (step if diff > 0 else -step)
+    sign = diff >> 63                    # 0 when diff >= 0, -1 when negative
+    mag = (diff ^ sign) - sign           # abs(diff)
+    step = speed_fx * dt
+    if step > mag:
+        step = mag                       # never overshoot the target
+    return current + ((step ^ sign) - sign)
+
 
 
 # =============================================================================
@@ -351,6 +629,7 @@ def _seed_prng(s):
     global _prng_state
     _prng_state = s if s != 0 else 1
 
+@micropython.native
 def _prng_next():
     global _prng_state
     x = _prng_state & 0xFFFFFFFF
@@ -360,104 +639,268 @@ def _prng_next():
     _prng_state = x & 0xFFFFFFFF
     return x
 
+def _prng_bits(nbits):
+    """nbits of randomness - masks instead of dividing, for hot callers."""
+    return _prng_next() & ((1 << nbits) - 1)
+
 def prng_range(lo, hi):
-    return lo + (_prng_next() % (hi - lo + 1))
+    # Multiply-shift instead of modulo: division is slow on the RP2350's
+    # base integer path, and a tiny bias is invisible in particle effects
+    return lo + (((_prng_next() >> 16) * (hi - lo + 1)) >> 16)
 
 
 # =============================================================================
 # Background Particles
 # =============================================================================
 
-class Particle:
-    __slots__ = ("x", "y", "vx", "vy", "life", "max_life", "color_idx")
+# 256-entry sine table scaled to +/-127; one full wave per 256 indexes.
+# Indexing this is far cheaper than a soft-float math.sin call per star.
+_SIN_LUT = array("b", (int(127 * math.sin(i * 2 * math.pi / 256)) for i in range(256)))
+
+def _sin_rate(k):
+    """Pre-scale a rad/ms animation rate into Q12 table steps per ms."""
+    return round(k * 256 / (2 * math.pi) * 4096)
+
+@micropython.native
+def isin(ms, k_q12, amp):
+    """Integer amp * sin(ms * k): two multiplies, shifts and a table load.
 
-    def __init__(self, x, y, vx, vy, life, color_idx=0):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.life = life
-        self.max_life = life
-        self.color_idx = color_idx
+    k_q12 comes from _sin_rate(); the pet animations call this up to ten
+    times a frame, where math.sin's soft-float cost really adds up.
+
+    ms * k_q12 in one go blows past MicroPython's 31-bit smallint range
+    within minutes of uptime at the faster rates, turning every call into
+    a bigint allocation. Splitting ms into 16-bit halves keeps each
+    partial product below 2^29 while producing the exact same table
+    index: the high half's contribution lands on bits >= 16, so after
+    >>12 it is just (hi * k) << 4, folded mod 256 before the add.
+    """
+    lo = (ms & 0xFFFF) * k_q12
+    hi = (ms >> 16) * k_q12
+    return (amp * _SIN_LUT[((lo >> 12) + ((hi & 0xF) << 4)) & 0xFF]) >> 7
+
+@micropython.native
+def iabsin(ms, k_q12, amp):
+    """Integer amp * abs(sin(ms * k)) for the bounce channels.
+
+    abs(sin) repeats every half wave and the first 128 table entries are
+    the non-negative half, so masking the index to 0x7F gives the folded
+    value directly - no abs() call, no sign branch. The split multiply
+    mirrors isin(): it keeps the phase math inside smallint range.
+    """
+    lo = (ms & 0xFFFF) * k_q12
+    hi = (ms >> 16) * k_q12
+    return (amp * _SIN_LUT[((lo >> 12) + ((hi & 0xF) << 4)) & 0x7F]) >> 7
+
+# Pens quantized ahead of time so the particle loops never call color.rgb
+# at draw time: 16 star brightness bins, and 8 fade bins per confetti color.
+_STAR_PENS = [rgb(b, b, (b * 6) // 5) for b in range(0, 128, 8)]
+_CONFETTI_PENS = [
+    [rgb((r * (f + 1)) // 8, (g * (f + 1)) // 8, (b * (f + 1)) // 8) for f in range(8)]
+    for (r, g, b) in CONFETTI_COLORS
+]
+
+# Pet palette converted to pens once at module load, in a normal and a
+# low-battery (85%) variant - beats rebuilding a dimmed tuple and calling
+# color.rgb for every primitive of every frame
+_PET_COLORS = dict(COLORS)
+_PET_COLORS["belly"] = (255, 220, 160)
+_PET_COLORS["menu_sel"] = (40, 40, 60)
+_PAL = {name: rgb(r, g, b) for name, (r, g, b) in _PET_COLORS.items()}
+_PAL_DIM = {name: rgb((r * 217) >> 8, (g * 217) >> 8, (b * 217) >> 8)
+            for name, (r, g, b) in _PET_COLORS.items()}
+
+# Confetti lives in one column-major int32 buffer (stride CONFETTI_COUNT):
+# x, y in Q8 pixels, vx, vy in Q8 pixels/step, then life, max_life, color.
+_CF_X = 0
+_CF_Y = CONFETTI_COUNT
+_CF_VX = CONFETTI_COUNT * 2
+_CF_VY = CONFETTI_COUNT * 3
+_CF_LIFE = CONFETTI_COUNT * 4
+_CF_MAXLIFE = CONFETTI_COUNT * 5
+_CF_COLOR = CONFETTI_COUNT * 6
+
+
+@micropython.viper
+def _step_confetti(buf: ptr32, n: int, dt: int, stride: int) -> int:
+    """Advance n confetti particles by one dt step; returns the new count.
+
+    Dead particles (life out, or fallen past y=120) are swap-removed so
+    the live set stays dense. Compiled with viper so the whole physics
+    step runs as native integer code.
+    """
+    i = 0
+    while i < n:
+        life = buf[stride * 4 + i] - dt
+        if life <= 0 or buf[stride + i] >= (120 << 8):
+            n -= 1
+            if i != n:
+                c = 0
+                while c < 7:
+                    buf[stride * c + i] = buf[stride * c + n]
+                    c += 1
+            continue
+        buf[stride * 4 + i] = life
+        buf[i] = buf[i] + buf[stride * 2 + i]
+        buf[stride + i] = buf[stride + i] + buf[stride * 3 + i]
+        buf[stride * 3 + i] = buf[stride * 3 + i] + (dt << 8) // 50
+        i += 1
+    return n
 
 
 class ParticleSystem:
     def __init__(self):
-        self.stars = []
-        self.confetti = []
+        self._confetti = array("i", (0 for _ in range(CONFETTI_COUNT * 7)))
+        self._confetti_n = 0
         self._last_spawn_ms = 0
+        self._sim_acc = 0
         self._init_stars()
-        print(f"[stockpet] Particles: {len(self.stars)} stars ready")
+        print(f"[stockpet] Particles: {STAR_COUNT} stars ready")
 
     def _init_stars(self):
+        # Parallel arrays rather than a list of dicts - indexed array access
+        # is much cheaper than per-frame dict hashing on MicroPython
         _seed_prng(42)
-        self.stars = []
-        for _ in range(STAR_COUNT):
-            self.stars.append({
-                "x": prng_range(4, 156),
-                "y": prng_range(22, 85),
-                "speed": prng_range(1, 3),
-                "phase": prng_range(0, 1000),
-                "bright": prng_range(40, 120),
-            })
+        self._star_x = array("i", (0 for _ in range(STAR_COUNT)))
+        self._star_y = array("i", (0 for _ in range(STAR_COUNT)))
+        self._star_speed = array("i", (0 for _ in range(STAR_COUNT)))
+        self._star_phase = array("i", (0 for _ in range(STAR_COUNT)))
+        self._star_bright = array("i", (0 for _ in range(STAR_COUNT)))
+        _range = prng_range
+        for i in range(STAR_COUNT):
+            self._star_x[i] = _range(4, 156)
+            self._star_y[i] = _range(22, 85)
+            self._star_speed[i] = _range(1, 3)
+            self._star_phase[i] = _range(0, 1000)
+            self._star_bright[i] = _range(40, 120)
 
     def spawn_confetti(self, cx, current_ms):
-        if len(self.confetti) >= CONFETTI_COUNT:
+        n = self._confetti_n
+        if n >= CONFETTI_COUNT:
             return
         if current_ms - self._last_spawn_ms < 200:
             return
         self._last_spawn_ms = current_ms
-        self.confetti.append(Particle(
-            x=prng_range(cx - 30, cx + 30),
-            y=prng_range(20, 35),
-            vx=prng_range(-10, 10) / 10.0,
-            vy=prng_range(5, 15) / 10.0,
-            life=prng_range(800, 1800),
-            color_idx=prng_range(0, len(CONFETTI_COLORS) - 1),
-        ))
+        buf = self._confetti
+        _range = prng_range
+        buf[_CF_X + n] = _range(cx - 30, cx + 30) << 8
+        buf[_CF_Y + n] = _range(20, 35) << 8
+        buf[_CF_VX + n] = _range(-10, 10) * 256 // 10
+        buf[_CF_VY + n] = _range(5, 15) * 256 // 10
+        life = _range(800, 1800)
+        buf[_CF_LIFE + n] = life
+        buf[_CF_MAXLIFE + n] = life
+        buf[_CF_COLOR + n] = _prng_bits(3)  # 8 confetti colors
+        self._confetti_n = n + 1
+
+    def tick_confetti(self, dt):
+        """Advance confetti physics in fixed SIM_STEP_MS steps.
+
+        Rendering may run faster or slower than the simulation rate; the
+        accumulator keeps motion speed constant either way.
+        """
+        self._sim_acc += dt
+        while self._sim_acc >= SIM_STEP_MS:
+            self.update_confetti(SIM_STEP_MS)
+            self._sim_acc -= SIM_STEP_MS
 
     def update_confetti(self, dt):
-        alive = []
-        for p in self.confetti:
-            p.life -= dt
-            if p.life <= 0:
-                continue
-            p.x += p.vx
-            p.y += p.vy
-            p.vy += 0.02 * dt
-            if p.y < 120:
-                alive.append(p)
-        self.confetti = alive
+        self._confetti_n = _step_confetti(self._confetti, self._confetti_n, dt, CONFETTI_COUNT)
 
     def draw_stars(self, current_ms, low_battery):
-        for s in self.stars:
-            twinkle = math.sin((current_ms + s["phase"]) * 0.001 * s["speed"])
-            bright = int(s["bright"] * (0.5 + 0.5 * twinkle))
+        # Hoist every global/attribute the loop touches into locals -
+        # each global or attribute load is a dict lookup per iteration
+        _screen = screen
+        _lut = _SIN_LUT
+        _pens = _STAR_PENS
+        # put() writes one pixel straight into the framebuffer; for 1x1
+        # stars that skips the whole rectangle rasterizer path
+        _put = _screen.put
+        xs = self._star_x
+        ys = self._star_y
+        speeds = self._star_speed
+        phases = self._star_phase
+        brights = self._star_bright
+        # The twinkle index only depends on the time modulo 6400ms (one
+        # LUT wrap is 25ms * 256 steps, and 6400 * speed is always a
+        # multiple of 25), so fold current_ms once here - the raw tick
+        # count would push the per-star multiply past smallint range
+        # after a few days of uptime
+        base_ms = current_ms % 6400
+        for i in range(STAR_COUNT):
+            # (ms * 0.001 * speed) radians ~= one LUT wrap per 6283ms/speed,
+            # so 25ms per table step keeps the original twinkle rate
+            twinkle = _lut[((base_ms + phases[i]) * speeds[i] // 25) & 0xFF]
+            bright = (brights[i] * (127 + twinkle)) >> 8
             if bright < 10:
                 continue
             if low_battery:
-                bright = int(bright * 0.85)
-            screen.pen = rgb(bright, bright, int(bright * 1.2))
-            screen.rectangle(s["x"], s["y"], 1, 1)
+                bright = (bright * 217) >> 8
+            _screen.pen = _pens[bright >> 3]
+            _put(xs[i], ys[i])
 
     def draw_confetti(self, low_battery):
-        for p in self.confetti:
-            fade = p.life / p.max_life
-            col = CONFETTI_COLORS[p.color_idx]
-            c = tuple(int(v * fade) for v in col)
-            if low_battery:
-                c = tuple(int(v * 0.85) for v in c)
-            screen.pen = rgb(*c)
-            if int(p.x) % 2 == 0:
-                screen.rectangle(int(p.x), int(p.y), 2, 1)
-            else:
-                screen.rectangle(int(p.x), int(p.y), 1, 2)
+        _screen = screen
+        _rect = _screen.rectangle
+        pens = _CONFETTI_PENS
+        buf = self._confetti
+        # Bucket particles by (color, fade) first so each pen - a driver
+        # state poke - is set once per bucket rather than once per particle
+        buckets = {}
+        for i in range(self._confetti_n):
+            fade_bin = (buf[_CF_LIFE + i] * 8) // buf[_CF_MAXLIFE + i]
+            if fade_bin > 7:
+                fade_bin = 7
+            # Low battery drops one fade bin (~12% dimmer) instead of
+            # rescaling the color - close enough to the old 0.85 factor
+            if low_battery and fade_bin:
+                fade_bin -= 1
+            key = (buf[_CF_COLOR + i] << 3) | fade_bin
+            xy = buckets.get(key)
+            if xy is None:
+                buckets[key] = xy = []
+            xy.append((buf[_CF_X + i] >> 8, buf[_CF_Y + i] >> 8))
+        for key, points in buckets.items():
+            _screen.pen = pens[key >> 3][key & 7]
+            for x, y in points:
+                if x % 2 == 0:
+                    _rect(x, y, 2, 1)
+                else:
+                    _rect(x, y, 1, 2)
 
 
 # =============================================================================
 # Pet Drawing
 # =============================================================================
 
+# Animation rates (rad/ms) used by PetRenderer, pre-scaled for isin()
+_K_BREATHE = _sin_rate(0.002)
+_K_SWAY = _sin_rate(0.003)
+_K_BOUNCE = _sin_rate(0.004)
+_K_BOUNCE_BIG = _sin_rate(0.006)
+_K_WAVE = _sin_rate(0.008)
+_K_TREMBLE = _sin_rate(0.012)
+_K_JITTER = _sin_rate(0.02)
+_K_PANIC = _sin_rate(0.025)
+
+# Per-mood body animation parameters:
+# (bounce_k, bounce_amp, tremble_k, tremble_amp, breathe_k, breathe_amp, cy_off)
+# isin() with a zero amplitude yields zero, so draw() can evaluate all three
+# channels unconditionally from one table row - no per-mood branching
+# Moods whose eyes never blink (already closed or X-ed out). A frozenset
+# constant avoids rebuilding a tuple operand on every face draw.
+_NO_BLINK_MOODS = frozenset(("sleeping", "down_big"))
+
+_MOOD_ANIM = {
+    "sleeping": (0, 0, 0, 0, _K_BREATHE, 2, 4),
+    "up_big": (_K_BOUNCE_BIG, 4, 0, 0, _K_SWAY, 2, 0),
+    "up": (_K_BOUNCE, 2, 0, 0, _K_SWAY, 1, 0),
+    "down": (0, 0, _K_TREMBLE, 1, _K_BREATHE, 1, 0),
+    "down_big": (0, 0, _K_PANIC, 2, _K_BREATHE, 1, 0),
+    "flat": (0, 0, 0, 0, _K_BREATHE, 1, 0),
+}
+
+
 class PetRenderer:
     """Draws the pet using primitives. Sprite-replaceable later.
     v0.2: arms, shadow, smooth lerp, blink, particles.
@@ -465,35 +908,76 @@ class PetRenderer:
 
     BASE_BODY_W = 36
     BASE_BODY_H = 30
-    MIN_SCALE = 0.45
-    MAX_SCALE = 1.8
+    # Scale is tracked in Q16.16 (65536 = 1.0) so the per-frame lerp and
+    # width math stay in native integers - no boxed floats on the hot path
+    SCALE_ONE = 65536
+    MIN_SCALE_FX = int(0.45 * 65536)
+    MAX_SCALE_FX = int(1.8 * 65536)
+    CLOSED_SCALE_FX = int(0.85 * 65536)
     PET_CENTER_X = 80
     PET_CENTER_Y = 62
 
     def __init__(self):
-        self._current_scale = 1.0
+        self._scale_fx = self.SCALE_ONE
         self._last_update_ms = time.ticks_ms()
         self._blink_active = False
         self._blink_start_ms = 0
         self._next_blink_ms = time.ticks_ms() + prng_range(BLINK_MIN_MS, BLINK_MAX_MS)
+        self._eye_cache = {}
         self.particles = ParticleSystem()
+        # Per-mood bound-method tables: one dict get per subsystem per frame
+        # instead of walking an if/elif ladder of string compares in each
+        self._arms_dispatch = {
+            "sleeping": self._arms_sleeping,
+            "up_big": self._arms_up_big,
+            "up": self._arms_up,
+            "down": self._arms_down,
+            "down_big": self._arms_down_big,
+        }
+        self._face_dispatch = {
+            "sleeping": self._face_sleeping,
+            "up_big": self._face_up_big,
+            "up": self._face_up,
+            "down": self._face_down,
+            "down_big": self._face_down_big,
+        }
+        self._mouth_dispatch = {
+            "up_big": self._mouth_up_big,
+            "up": self._mouth_up,
+            "down": self._mouth_down,
+            "down_big": self._mouth_down_big,
+        }
+        self._legs_dispatch = {
+            "sleeping": self._legs_sleeping,
+            "up_big": self._legs_up_big,
+            "down_big": self._legs_down_big,
+        }
+        self._effects_dispatch = {
+            "sleeping": self._fx_sleeping,
+            "up_big": self._fx_up_big,
+            "down": self._fx_down,
+            "down_big": self._fx_down_big,
+        }
         print("[stockpet] PetRenderer initialized (v0.2)")
 
-    def _get_target_scale(self, change_percent, market_open):
+    def _get_target_scale_fx(self, change_percent, market_open):
         if not market_open:
-            return 0.85
-        pct = clamp(change_percent, -5.0, 5.0)
-        if pct >= 0:
-            return 1.0 + (pct / 5.0) * (self.MAX_SCALE - 1.0)
-        else:
-            return 1.0 + (pct / 5.0) * (1.0 - self.MIN_SCALE)
-
-    def _update_smooth_scale(self, change_percent, market_open, current_ms):
-        target = self._get_target_scale(change_percent, market_open)
-        dt = min(time.ticks_diff(current_ms, self._last_update_ms), 100)
-        self._last_update_ms = current_ms
-        self._current_scale = lerp(self._current_scale, target, LERP_SPEED, dt)
-        return self._current_scale
+            return self.CLOSED_SCALE_FX
+        pct_i = clamp(int(change_percent * 100), -500, 500)
+        if pct_i >= 0:
+            return self.SCALE_ONE + pct_i * (self.MAX_SCALE_FX - self.SCALE_ONE) // 500
+        return self.SCALE_ONE + pct_i * (self.SCALE_ONE - self.MIN_SCALE_FX) // 500
+
+    def _update_smooth_scale(self, change_percent, market_open, dt):
+        target = self._get_target_scale_fx(change_percent, market_open)
+        self._scale_fx = lerp_fx(self._scale_fx, target, _LERP_SPEED_FX, dt)
+        return self._scale_fx
+
+    def is_static(self, change_percent, market_open, current_ms):
+        """True when no blink or scale lerp would move pixels this frame."""
+        return (not self._blink_active
+                and time.ticks_diff(current_ms, self._next_blink_ms) < 0
+                and abs(self._scale_fx - self._get_target_scale_fx(change_percent, market_open)) < 656)
 
     def _update_blink(self, current_ms, mood_key):
         if mood_key == "sleeping":
@@ -511,79 +995,68 @@ class PetRenderer:
                 return True
             return False
 
-    def _dim(self, rgb_tuple, low_battery):
-        if low_battery:
-            return tuple(int(c * 0.85) for c in rgb_tuple)
-        return rgb_tuple
-
-    def draw(self, change_percent, market_open, mood_key, current_ms, low_battery=False):
-        scale = self._update_smooth_scale(change_percent, market_open, current_ms)
+    def draw(self, change_percent, market_open, mood_key, current_ms, low_battery=False, skip_decor=False):
+        dt = min(time.ticks_diff(current_ms, self._last_update_ms), 100)
+        self._last_update_ms = current_ms
+        scale = self._update_smooth_scale(change_percent, market_open, dt)
         is_blinking = self._update_blink(current_ms, mood_key)
-        bw = int(self.BASE_BODY_W * scale)
+        # Quantize the body width to 2px steps: a 1px wobble every few
+        # frames of lerp is invisible, but it would thrash the eye-sprite
+        # cache and defeat the frame-skip check
+        bw = ((self.BASE_BODY_W * scale) >> 16) & ~1
         bh = self.BASE_BODY_H
         cx = self.PET_CENTER_X
         cy = self.PET_CENTER_Y
 
-        bounce_y = 0
-        tremble_x = 0
-        breathe_w = 0
-
-        if mood_key == "sleeping":
-            breathe_w = int(2 * math.sin(current_ms * 0.002))
-            cy += 4
-        elif mood_key == "up_big":
-            bounce_y = int(4 * abs(math.sin(current_ms * 0.006)))
-            breathe_w = int(2 * math.sin(current_ms * 0.003))
-        elif mood_key == "up":
-            bounce_y = int(2 * abs(math.sin(current_ms * 0.004)))
-            breathe_w = int(1 * math.sin(current_ms * 0.003))
-        elif mood_key == "down":
-            tremble_x = int(1 * math.sin(current_ms * 0.012))
-            breathe_w = int(1 * math.sin(current_ms * 0.002))
-        elif mood_key == "down_big":
-            tremble_x = int(2 * math.sin(current_ms * 0.025))
-            breathe_w = int(1 * math.sin(current_ms * 0.002))
-        else:
-            breathe_w = int(1 * math.sin(current_ms * 0.002))
+        bk, ba, tk, ta, rk, ra, cy_off = _MOOD_ANIM.get(mood_key, _MOOD_ANIM["flat"])
+        # Every mood breathes, but only two bounce and two tremble - skip
+        # the table walk entirely when the row's amplitude is zero
+        bounce_y = iabsin(current_ms, bk, ba) if ba else 0
+        tremble_x = isin(current_ms, tk, ta) if ta else 0
+        breathe_w = isin(current_ms, rk, ra)
+        cy += cy_off
 
         fw = bw + breathe_w
         fx = cx + tremble_x
         fy = cy - bounce_y
 
-        # Background particles (behind pet)
+        # Background particles (behind pet) - purely decorative, so they are
+        # the first thing dropped when frames run over budget
         if mood_key == "sleeping":
-            self.particles.draw_stars(current_ms, low_battery)
+            if not skip_decor:
+                self.particles.draw_stars(current_ms, low_battery)
         elif mood_key == "up_big":
             self.particles.spawn_confetti(cx, current_ms)
-            self.particles.update_confetti(16)
-            self.particles.draw_confetti(low_battery)
-
-        self._draw_shadow(fx, fy, fw, bh, bounce_y, mood_key, low_battery)
-        self._draw_body(fx, fy, fw, bh, mood_key, low_battery)
-        self._draw_arms(fx, fy, fw, bh, mood_key, current_ms, low_battery)
-        self._draw_face(fx, fy, fw, bh, mood_key, current_ms, is_blinking, low_battery)
-        self._draw_legs(fx, fy, fw, bh, mood_key, current_ms, low_battery)
-        self._draw_effects(fx, fy, fw, bh, mood_key, current_ms, low_battery)
-
-    def _draw_shadow(self, cx, cy, w, h, bounce_y, mood_key, low_battery):
+            self.particles.tick_confetti(dt)
+            if not skip_decor:
+                self.particles.draw_confetti(low_battery)
+
+        pal = _PAL_DIM if low_battery else _PAL
+        self._draw_shadow(fx, fy, fw, bh, bounce_y, mood_key, pal)
+        self._draw_body(fx, fy, fw, bh, mood_key, pal)
+        self._arms_dispatch.get(mood_key, self._arms_flat)(fx, fy, fw, bh, current_ms, pal)
+        self._draw_face(fx, fy, fw, bh, mood_key, current_ms, is_blinking, pal)
+        self._legs_dispatch.get(mood_key, self._legs_flat)(fx, fy, fw, bh, current_ms, pal)
+        effect = self._effects_dispatch.get(mood_key)
+        if effect:
+            effect(fx, fy, fw, bh, current_ms, pal)
+
+    def _draw_shadow(self, cx, cy, w, h, bounce_y, mood_key, pal):
         ground_y = 87
-        shadow_col = COLORS["shadow_sleep"] if mood_key == "sleeping" else COLORS["shadow"]
-        shadow_col = self._dim(shadow_col, low_battery)
         sw = max(8, int(w * 0.8) - bounce_y)
         sh = max(2, 4 - bounce_y // 2)
         sx = cx - sw // 2
-        screen.pen = rgb(*shadow_col)
+        screen.pen = pal["shadow_sleep"] if mood_key == "sleeping" else pal["shadow"]
         screen.rectangle(sx + 2, ground_y, sw - 4, sh)
         if sh > 2:
             screen.rectangle(sx, ground_y + 1, sw, sh - 2)
 
-    def _draw_body(self, cx, cy, w, h, mood_key, low_battery):
-        skin = self._dim(COLORS["skin"], low_battery)
+    def _draw_body(self, cx, cy, w, h, mood_key, pal):
         x = cx - w // 2
         y = cy - h // 2
         inset = max(4, w // 6)
         cap_h = max(3, h // 5)
-        screen.pen = rgb(*skin)
+        screen.pen = pal["skin"]
         screen.rectangle(x + inset, y, w - inset * 2, cap_h)
         screen.rectangle(x, y + cap_h, w, h - cap_h * 2)
         screen.rectangle(x + inset, y + h - cap_h, w - inset * 2, cap_h)
@@ -593,217 +1066,295 @@ class PetRenderer:
         if w > 16:
             bw2 = max(4, w // 3)
             bh2 = max(4, h // 3)
-            screen.pen = rgb(*self._dim((255, 220, 160), low_battery))
+            screen.pen = pal["belly"]
             screen.rectangle(cx - bw2 // 2, cy - bh2 // 2 + 2, bw2, bh2)
 
-    def _draw_arms(self, cx, cy, w, h, mood_key, current_ms, low_battery):
-        """Arms: raised when happy, drooped when sad, tucked when sleeping."""
-        arm_col = self._dim(COLORS["arm"], low_battery)
-        screen.pen = rgb(*arm_col)
+    # Arms: raised when happy, drooped when sad, tucked when sleeping.
+    # One method per mood so draw() dispatches without a string-compare ladder.
+
+    def _arms_sleeping(self, cx, cy, w, h, _current_ms, pal):
+        screen.pen = pal["arm"]
+        tuck_y = cy + h // 4
+        screen.rectangle(cx - w // 2 - 2, tuck_y, 4, 3)
+        screen.rectangle(cx + w // 2 - 2, tuck_y, 4, 3)
+
+    def _arms_up_big(self, cx, cy, w, _h, current_ms, pal):
+        screen.pen = pal["arm"]
+        body_left = cx - w // 2
+        body_right = cx + w // 2
+        arm_y_base = cy - 2
+        wave = isin(current_ms, _K_WAVE, 2)
+        # 45-degree wave: 3 parallel 1px lines per arm replace
+        # arm_len single-column rectangle calls
+        el = max(5, w // 5) - 1
+        for k in range(3):
+            screen.line(body_left - 1, arm_y_base + wave + k,
+                        body_left - 1 - el, arm_y_base - el + wave + k)
+            screen.line(body_right, arm_y_base - wave + k,
+                        body_right + el, arm_y_base - el - wave + k)
+
+    def _arms_up(self, cx, cy, w, _h, _current_ms, pal):
+        screen.pen = pal["arm"]
         arm_len = max(5, w // 5)
-        arm_w = 3
         body_left = cx - w // 2
         body_right = cx + w // 2
         arm_y_base = cy - 2
+        # Slope is 1/2, so pairs of columns share a row - emit 2-wide runs
+        for i in range(0, arm_len, 2):
+            run = 2 if i + 1 < arm_len else 1
+            y = arm_y_base - i // 2
+            screen.rectangle(body_left - i - run, y, run, 3)
+            screen.rectangle(body_right + i, y, run, 3)
+
+    def _arms_down(self, cx, cy, w, _h, _current_ms, pal):
+        screen.pen = pal["arm"]
+        arm_len = max(5, w // 5)
+        body_left = cx - w // 2
+        body_right = cx + w // 2
+        arm_y_base = cy - 2
+        for i in range(0, arm_len, 2):
+            run = 2 if i + 1 < arm_len else 1
+            y = arm_y_base + i // 2
+            screen.rectangle(body_left - i - run, y, run, 3)
+            screen.rectangle(body_right + i, y, run, 3)
+
+    def _arms_down_big(self, cx, cy, w, _h, _current_ms, pal):
+        screen.pen = pal["arm"]
+        arm_len = max(5, w // 5)
+        arm_y_base = cy - 2
+        # Straight-down arms collapse to one rectangle each
+        screen.rectangle(cx - w // 2 - 2, arm_y_base, 3, arm_len)
+        screen.rectangle(cx + w // 2 - 1, arm_y_base, 3, arm_len)
 
-        if mood_key == "sleeping":
-            tuck_y = cy + h // 4
-            screen.rectangle(body_left - 2, tuck_y, 4, arm_w)
-            screen.rectangle(body_right - 2, tuck_y, 4, arm_w)
-        elif mood_key == "up_big":
-            wave = int(2 * math.sin(current_ms * 0.008))
-            for i in range(arm_len):
-                screen.rectangle(body_left - 1 - i, arm_y_base - i + wave, 1, arm_w)
-            for i in range(arm_len):
-                screen.rectangle(body_right + i, arm_y_base - i - wave, 1, arm_w)
-        elif mood_key == "up":
-            for i in range(arm_len):
-                screen.rectangle(body_left - 1 - i, arm_y_base - i // 2, 1, arm_w)
-            for i in range(arm_len):
-                screen.rectangle(body_right + i, arm_y_base - i // 2, 1, arm_w)
-        elif mood_key == "down":
-            for i in range(arm_len):
-                screen.rectangle(body_left - 1 - i, arm_y_base + i // 2, 1, arm_w)
-            for i in range(arm_len):
-                screen.rectangle(body_right + i, arm_y_base + i // 2, 1, arm_w)
-        elif mood_key == "down_big":
-            for i in range(arm_len):
-                screen.rectangle(body_left - 2, arm_y_base + i, arm_w, 1)
-            for i in range(arm_len):
-                screen.rectangle(body_right - 1, arm_y_base + i, arm_w, 1)
-        else:  # flat
-            screen.rectangle(body_left - arm_len, arm_y_base, arm_len, arm_w)
-            screen.rectangle(body_right, arm_y_base, arm_len, arm_w)
-
-    def _draw_face(self, cx, cy, w, h, mood_key, current_ms, is_blinking, low_battery):
+    def _arms_flat(self, cx, cy, w, _h, _current_ms, pal):
+        screen.pen = pal["arm"]
+        arm_len = max(5, w // 5)
+        arm_y_base = cy - 2
+        screen.rectangle(cx - w // 2 - arm_len, arm_y_base, arm_len, 3)
+        screen.rectangle(cx + w // 2, arm_y_base, arm_len, 3)
+
+    def _eye_sprite(self, eye_r, mood_key, dimmed):
+        """Pre-rendered eye for this radius/mood/dim combo.
+
+        circle() runs a per-pixel in/out test over its bounding box every
+        call, but for a given integer radius the eye never changes - so
+        rasterize it once into a small offscreen image and blit it after
+        that. Radii follow the body width, which only takes a handful of
+        integer values.
+        """
+        key = (eye_r, mood_key, dimmed)
+        sprite = self._eye_cache.get(key)
+        if sprite is None:
+            if len(self._eye_cache) >= 8:
+                self._eye_cache.clear()
+            pal = _PAL_DIM if dimmed else _PAL
+            c = eye_r + 1
+            sprite = image(c * 2 + 1, c * 2 + 1)
+            if mood_key == "flat":
+                sprite.pen = pal["eye_pupil"]
+                sprite.circle(c, c, eye_r)
+            else:
+                sprite.pen = pal["eye_white"]
+                sprite.circle(c, c, eye_r + 1)
+                sprite.pen = pal["eye_pupil"]
+                sprite.circle(c, c + (1 if mood_key == "down" else 0), eye_r)
+                if mood_key == "up_big":
+                    sprite.pen = pal["eye_white"]
+                    sprite.rectangle(c - 1, c - 1, 1, 1)
+            self._eye_cache[key] = sprite
+        return sprite
+
+    def _blit_eyes(self, cx, eye_spacing, eye_y, eye_r, mood_key, pal):
+        sprite = self._eye_sprite(eye_r, mood_key, pal is _PAL_DIM)
+        c = eye_r + 1
+        screen.blit(sprite, vec2(cx - eye_spacing - c, eye_y - c))
+        screen.blit(sprite, vec2(cx + eye_spacing - c, eye_y - c))
+
+    def _draw_face(self, cx, cy, w, h, mood_key, _current_ms, is_blinking, pal):
         face_y = cy - h // 4
         eye_spacing = max(6, w // 4)
-        eye_y = face_y
 
         # Blink override: draw closed eyes + mood mouth
-        if is_blinking and mood_key not in ("sleeping", "down_big"):
+        if is_blinking and mood_key not in _NO_BLINK_MOODS:
             line_w = max(3, w // 8)
-            screen.pen = rgb(*self._dim(COLORS["eye_pupil"], low_battery))
-            screen.rectangle(cx - eye_spacing - line_w // 2, eye_y, line_w, 1)
-            screen.rectangle(cx + eye_spacing - line_w // 2, eye_y, line_w, 1)
-            self._draw_mouth(cx, face_y, w, mood_key, low_battery)
+            screen.pen = pal["eye_pupil"]
+            screen.rectangle(cx - eye_spacing - line_w // 2, face_y, line_w, 1)
+            screen.rectangle(cx + eye_spacing - line_w // 2, face_y, line_w, 1)
+            self._mouth_dispatch.get(mood_key, self._mouth_flat)(cx, face_y, w, pal)
             return
 
-        if mood_key == "sleeping":
-            line_w = max(3, w // 8)
-            screen.pen = rgb(*self._dim(COLORS["eye_pupil"], low_battery))
-            screen.rectangle(cx - eye_spacing - line_w // 2, eye_y, line_w, 1)
-            screen.rectangle(cx + eye_spacing - line_w // 2, eye_y, line_w, 1)
-            screen.pen = rgb(*self._dim(COLORS["mouth"], low_battery))
-            screen.rectangle(cx - 2, face_y + 8, 4, 1)
-
-        elif mood_key == "down_big":
-            sz = max(2, w // 10)
-            screen.pen = rgb(*self._dim(COLORS["eye_pupil"], low_battery))
-            for side in [-1, 1]:
-                ex = cx + side * eye_spacing
-                screen.line(ex - sz, eye_y - sz, ex + sz, eye_y + sz)
-                screen.line(ex - sz, eye_y + sz, ex + sz, eye_y - sz)
-            self._draw_mouth(cx, face_y, w, mood_key, low_battery)
-
-        elif mood_key == "down":
-            eye_r = max(2, w // 10)
-            screen.pen = rgb(*self._dim(COLORS["eye_white"], low_battery))
-            screen.circle(cx - eye_spacing, eye_y, eye_r + 1)
-            screen.circle(cx + eye_spacing, eye_y, eye_r + 1)
-            screen.pen = rgb(*self._dim(COLORS["eye_pupil"], low_battery))
-            screen.circle(cx - eye_spacing, eye_y + 1, eye_r)
-            screen.circle(cx + eye_spacing, eye_y + 1, eye_r)
-            self._draw_mouth(cx, face_y, w, mood_key, low_battery)
-
-        elif mood_key == "up_big":
-            eye_r = max(2, w // 8)
-            screen.pen = rgb(*self._dim(COLORS["eye_white"], low_battery))
-            screen.circle(cx - eye_spacing, eye_y, eye_r + 1)
-            screen.circle(cx + eye_spacing, eye_y, eye_r + 1)
-            screen.pen = rgb(*self._dim(COLORS["eye_pupil"], low_battery))
-            screen.circle(cx - eye_spacing, eye_y, eye_r)
-            screen.circle(cx + eye_spacing, eye_y, eye_r)
-            screen.pen = rgb(*self._dim(COLORS["eye_white"], low_battery))
-            screen.rectangle(cx - eye_spacing - 1, eye_y - 1, 1, 1)
-            screen.rectangle(cx + eye_spacing - 1, eye_y - 1, 1, 1)
-            self._draw_mouth(cx, face_y, w, mood_key, low_battery)
-            screen.pen = rgb(*self._dim(COLORS["blush"], low_battery))
-            blush_x = max(8, w // 3)
-            screen.rectangle(cx - blush_x - 2, face_y + 5, 3, 2)
-            screen.rectangle(cx + blush_x, face_y + 5, 3, 2)
-
-        elif mood_key == "up":
-            eye_r = max(2, w // 9)
-            screen.pen = rgb(*self._dim(COLORS["eye_white"], low_battery))
-            screen.circle(cx - eye_spacing, eye_y, eye_r + 1)
-            screen.circle(cx + eye_spacing, eye_y, eye_r + 1)
-            screen.pen = rgb(*self._dim(COLORS["eye_pupil"], low_battery))
-            screen.circle(cx - eye_spacing, eye_y, eye_r)
-            screen.circle(cx + eye_spacing, eye_y, eye_r)
-            self._draw_mouth(cx, face_y, w, mood_key, low_battery)
-
-        else:  # flat
-            eye_r = max(1, w // 10)
-            screen.pen = rgb(*self._dim(COLORS["eye_pupil"], low_battery))
-            screen.circle(cx - eye_spacing, eye_y, eye_r)
-            screen.circle(cx + eye_spacing, eye_y, eye_r)
-            self._draw_mouth(cx, face_y, w, mood_key, low_battery)
-
-    def _draw_mouth(self, cx, face_y, w, mood_key, low_battery):
-        screen.pen = rgb(*self._dim(COLORS["mouth"], low_battery))
-        if mood_key == "up_big":
-            mw = max(6, w // 3)
-            screen.line(cx - mw, face_y + 7, cx, face_y + 11)
-            screen.line(cx, face_y + 11, cx + mw, face_y + 7)
-        elif mood_key == "up":
-            mw = max(4, w // 4)
-            screen.line(cx - mw, face_y + 7, cx, face_y + 10)
-            screen.line(cx, face_y + 10, cx + mw, face_y + 7)
-        elif mood_key in ("down_big", "down"):
-            mw = max(4, w // 4 if mood_key == "down_big" else w // 5)
-            depth = 11 if mood_key == "down_big" else 10
-            screen.line(cx - mw, face_y + 8, cx, face_y + depth)
-            screen.line(cx, face_y + depth, cx + mw, face_y + 8)
-        else:
-            mw = max(3, w // 5)
-            screen.rectangle(cx - mw // 2, face_y + 8, mw, 1)
+        self._face_dispatch.get(mood_key, self._face_flat)(cx, face_y, eye_spacing, w, pal)
+
+    def _face_sleeping(self, cx, face_y, eye_spacing, w, pal):
+        line_w = max(3, w // 8)
+        screen.pen = pal["eye_pupil"]
+        screen.rectangle(cx - eye_spacing - line_w // 2, face_y, line_w, 1)
+        screen.rectangle(cx + eye_spacing - line_w // 2, face_y, line_w, 1)
+        screen.pen = pal["mouth"]
+        screen.rectangle(cx - 2, face_y + 8, 4, 1)
+
+    def _face_down_big(self, cx, face_y, eye_spacing, w, pal):
+        sz = max(2, w // 10)
+        screen.pen = pal["eye_pupil"]
+        for side in (-1, 1):
+            ex = cx + side * eye_spacing
+            screen.line(ex - sz, face_y - sz, ex + sz, face_y + sz)
+            screen.line(ex - sz, face_y + sz, ex + sz, face_y - sz)
+        self._mouth_down_big(cx, face_y, w, pal)
+
+    def _face_down(self, cx, face_y, eye_spacing, w, pal):
+        self._blit_eyes(cx, eye_spacing, face_y, max(2, w // 10), "down", pal)
+        self._mouth_down(cx, face_y, w, pal)
+
+    def _face_up_big(self, cx, face_y, eye_spacing, w, pal):
+        self._blit_eyes(cx, eye_spacing, face_y, max(2, w // 8), "up_big", pal)
+        self._mouth_up_big(cx, face_y, w, pal)
+        screen.pen = pal["blush"]
+        blush_x = max(8, w // 3)
+        screen.rectangle(cx - blush_x - 2, face_y + 5, 3, 2)
+        screen.rectangle(cx + blush_x, face_y + 5, 3, 2)
+
+    def _face_up(self, cx, face_y, eye_spacing, w, pal):
+        self._blit_eyes(cx, eye_spacing, face_y, max(2, w // 9), "up", pal)
+        self._mouth_up(cx, face_y, w, pal)
+
+    def _face_flat(self, cx, face_y, eye_spacing, w, pal):
+        self._blit_eyes(cx, eye_spacing, face_y, max(1, w // 10), "flat", pal)
+        self._mouth_flat(cx, face_y, w, pal)
+
+    def _mouth_up_big(self, cx, face_y, w, pal):
+        screen.pen = pal["mouth"]
+        mw = max(6, w // 3)
+        screen.line(cx - mw, face_y + 7, cx, face_y + 11)
+        screen.line(cx, face_y + 11, cx + mw, face_y + 7)
+
+    def _mouth_up(self, cx, face_y, w, pal):
+        screen.pen = pal["mouth"]
+        mw = max(4, w // 4)
+        screen.line(cx - mw, face_y + 7, cx, face_y + 10)
+        screen.line(cx, face_y + 10, cx + mw, face_y + 7)
+
+    def _mouth_down_big(self, cx, face_y, w, pal):
+        screen.pen = pal["mouth"]
+        mw = max(4, w // 4)
+        screen.line(cx - mw, face_y + 8, cx, face_y + 11)
+        screen.line(cx, face_y + 11, cx + mw, face_y + 8)
+
+    def _mouth_down(self, cx, face_y, w, pal):
+        screen.pen = pal["mouth"]
+        mw = max(4, w // 5)
+        screen.line(cx - mw, face_y + 8, cx, face_y + 10)
+        screen.line(cx, face_y + 10, cx + mw, face_y + 8)
+
+    def _mouth_flat(self, cx, face_y, w, pal):
+        screen.pen = pal["mouth"]
+        mw = max(3, w // 5)
+        screen.rectangle(cx - mw // 2, face_y + 8, mw, 1)
+
+    def _legs_sleeping(self, cx, cy, w, h, _current_ms, pal):
+        leg_w = max(3, w // 6)
+        body_bottom = cy + h // 2
+        spread = max(4, w // 4)
+        screen.pen = pal["skin_dark"]
+        screen.rectangle(cx - spread - leg_w // 2, body_bottom - 1, leg_w, 3)
+        screen.rectangle(cx + spread - leg_w // 2, body_bottom - 1, leg_w, 3)
 
-    def _draw_legs(self, cx, cy, w, h, mood_key, current_ms, low_battery):
+    def _legs_up_big(self, cx, cy, w, h, current_ms, pal):
         leg_w = max(3, w // 6)
         leg_h = 6
         body_bottom = cy + h // 2
-        screen.pen = rgb(*self._dim(COLORS["skin_dark"], low_battery))
         spread = max(4, w // 4)
+        step = isin(current_ms, _K_WAVE, 3)
+        screen.pen = pal["skin_dark"]
+        screen.rectangle(cx - spread - leg_w // 2, body_bottom, leg_w, leg_h + step)
+        screen.rectangle(cx + spread - leg_w // 2, body_bottom, leg_w, leg_h - step)
+        foot_w = leg_w + 2
+        foot_y = body_bottom + leg_h
+        screen.rectangle(cx - spread - foot_w // 2, foot_y + step, foot_w, 2)
+        screen.rectangle(cx + spread - foot_w // 2, foot_y - step, foot_w, 2)
 
-        if mood_key == "sleeping":
-            screen.rectangle(cx - spread - leg_w // 2, body_bottom - 1, leg_w, 3)
-            screen.rectangle(cx + spread - leg_w // 2, body_bottom - 1, leg_w, 3)
-        elif mood_key == "up_big":
-            step = int(3 * math.sin(current_ms * 0.008))
-            screen.rectangle(cx - spread - leg_w // 2, body_bottom, leg_w, leg_h + step)
-            screen.rectangle(cx + spread - leg_w // 2, body_bottom, leg_w, leg_h - step)
-        elif mood_key == "down_big":
-            jitter = int(1 * math.sin(current_ms * 0.02))
-            screen.rectangle(cx - spread - leg_w // 2 + jitter, body_bottom, leg_w, leg_h)
-            screen.rectangle(cx + spread - leg_w // 2 - jitter, body_bottom, leg_w, leg_h)
-        else:
-            screen.rectangle(cx - spread - leg_w // 2, body_bottom, leg_w, leg_h)
-            screen.rectangle(cx + spread - leg_w // 2, body_bottom, leg_w, leg_h)
+    def _legs_down_big(self, cx, cy, w, h, current_ms, pal):
+        leg_w = max(3, w // 6)
+        leg_h = 6
+        body_bottom = cy + h // 2
+        spread = max(4, w // 4)
+        jitter = isin(current_ms, _K_JITTER, 1)
+        screen.pen = pal["skin_dark"]
+        screen.rectangle(cx - spread - leg_w // 2 + jitter, body_bottom, leg_w, leg_h)
+        screen.rectangle(cx + spread - leg_w // 2 - jitter, body_bottom, leg_w, leg_h)
+        foot_w = leg_w + 2
+        foot_y = body_bottom + leg_h
+        screen.rectangle(cx - spread - foot_w // 2, foot_y, foot_w, 2)
+        screen.rectangle(cx + spread - foot_w // 2, foot_y, foot_w, 2)
 
-        # Feet
+    def _legs_flat(self, cx, cy, w, h, _current_ms, pal):
+        leg_w = max(3, w // 6)
+        leg_h = 6
+        body_bottom = cy + h // 2
+        spread = max(4, w // 4)
+        screen.pen = pal["skin_dark"]
+        screen.rectangle(cx - spread - leg_w // 2, body_bottom, leg_w, leg_h)
+        screen.rectangle(cx + spread - leg_w // 2, body_bottom, leg_w, leg_h)
         foot_w = leg_w + 2
-        foot_h = 2
-        if mood_key != "sleeping":
-            foot_y = body_bottom + leg_h
-            if mood_key == "up_big":
-                step = int(3 * math.sin(current_ms * 0.008))
-                screen.rectangle(cx - spread - foot_w // 2, foot_y + step, foot_w, foot_h)
-                screen.rectangle(cx + spread - foot_w // 2, foot_y - step, foot_w, foot_h)
-            else:
-                screen.rectangle(cx - spread - foot_w // 2, foot_y, foot_w, foot_h)
-                screen.rectangle(cx + spread - foot_w // 2, foot_y, foot_w, foot_h)
+        foot_y = body_bottom + leg_h
+        screen.rectangle(cx - spread - foot_w // 2, foot_y, foot_w, 2)
+        screen.rectangle(cx + spread - foot_w // 2, foot_y, foot_w, 2)
 
-    def _draw_effects(self, cx, cy, w, h, mood_key, current_ms, low_battery):
-        if mood_key == "sleeping":
-            self._draw_zzz(cx + w // 2 + 6, cy - h // 2 - 8, current_ms, low_battery)
-        elif mood_key == "down_big":
-            face_y = cy - h // 4
-            eye_spacing = max(6, w // 4)
-            tear_phase = (current_ms % 1200) / 1200.0
-            tear_y = int(face_y + 3 + tear_phase * 14)
-            if (1.0 - tear_phase) > 0.3:
-                screen.pen = rgb(*self._dim(COLORS["tear"], low_battery))
-                screen.rectangle(cx - eye_spacing, tear_y, 1, 2)
-                screen.rectangle(cx + eye_spacing, tear_y, 1, 2)
-        elif mood_key == "down":
-            sweat_phase = (current_ms % 2000) / 2000.0
-            sweat_y = int(cy - h // 3 + sweat_phase * 10)
-            if sweat_phase < 0.7:
-                screen.pen = rgb(*self._dim(COLORS["sweat"], low_battery))
-                screen.rectangle(cx + w // 2 + 3, sweat_y, 2, 2)
-        elif mood_key == "up_big":
-            phase1 = (current_ms % 2500) / 2500.0
-            phase2 = ((current_ms + 1200) % 2500) / 2500.0
-            screen.pen = rgb(*self._dim(COLORS["up"], low_battery))
-            for phase, x_off in [(phase1, -w // 2 - 8), (phase2, w // 2 + 6)]:
-                if phase < 0.8:
-                    my = int(cy - phase * 30)
-                    mx = cx + x_off
-                    screen.rectangle(mx, my, 1, 5)
-                    screen.rectangle(mx - 1, my + 1, 3, 1)
-                    screen.rectangle(mx - 1, my + 3, 3, 1)
-
-    def _draw_zzz(self, x, y, current_ms, low_battery):
-        screen.pen = rgb(*self._dim(COLORS["zzz"], low_battery))
-        for i in range(3):
-            phase = ((current_ms + i * 800) % 2400) / 2400.0
-            zx = x + i * 5
-            zy = int(y - phase * 12)
-            sz = 2 + i
-            screen.rectangle(zx, zy, sz, 1)
-            screen.line(zx + sz - 1, zy, zx, zy + sz)
-            screen.rectangle(zx, zy + sz, sz, 1)
+    def _fx_sleeping(self, cx, cy, w, h, current_ms, pal):
+        self._draw_zzz(cx + w // 2 + 6, cy - h // 2 - 8, current_ms, pal)
+
+    def _fx_down_big(self, cx, cy, w, h, current_ms, pal):
+        face_y = cy - h // 4
+        eye_spacing = max(6, w // 4)
+        tear_phase = (current_ms % 1200) / 1200.0
+        tear_y = int(face_y + 3 + tear_phase * 14)
+        if (1.0 - tear_phase) > 0.3:
+            screen.pen = pal["tear"]
+            screen.rectangle(cx - eye_spacing, tear_y, 1, 2)
+            screen.rectangle(cx + eye_spacing, tear_y, 1, 2)
+
+    def _fx_down(self, cx, cy, w, h, current_ms, pal):
+        sweat_phase = (current_ms % 2000) / 2000.0
+        sweat_y = int(cy - h // 3 + sweat_phase * 10)
+        if sweat_phase < 0.7:
+            screen.pen = pal["sweat"]
+            screen.rectangle(cx + w // 2 + 3, sweat_y, 2, 2)
+
+    def _fx_up_big(self, cx, cy, w, _h, current_ms, pal):
+        phase1 = (current_ms % 2500) / 2500.0
+        phase2 = ((current_ms + 1200) % 2500) / 2500.0
+        screen.pen = pal["up"]
+        for phase, x_off in [(phase1, -w // 2 - 8), (phase2, w // 2 + 6)]:
+            if phase < 0.8:
+                my = int(cy - phase * 30)
+                mx = cx + x_off
+                screen.rectangle(mx, my, 1, 5)
+                screen.rectangle(mx - 1, my + 1, 3, 1)
+                screen.rectangle(mx - 1, my + 3, 3, 1)
+
+    def _draw_zzz(self, x, y, current_ms, pal):
+        # Always exactly three Zs: unrolled, with the per-Z phase kept in
+        # integer math instead of a float divide per iteration
+        screen.pen = pal["zzz"]
+        rect = screen.rectangle
+        line = screen.line
+
+        zy = y - ((current_ms % 2400) * 12) // 2400
+        rect(x, zy, 2, 1)
+        line(x + 1, zy, x, zy + 2)
+        rect(x, zy + 2, 2, 1)
+
+        zx = x + 5
+        zy = y - (((current_ms + 800) % 2400) * 12) // 2400
+        rect(zx, zy, 3, 1)
+        line(zx + 2, zy, zx, zy + 3)
+        rect(zx, zy + 3, 3, 1)
+
+        zx = x + 10
+        zy = y - (((current_ms + 1600) % 2400) * 12) // 2400
+        rect(zx, zy, 4, 1)
+        line(zx + 3, zy, zx, zy + 4)
+        rect(zx, zy + 4, 4, 1)
 
 
 # =============================================================================
@@ -817,54 +1368,72 @@ class PetDisplay:
         self.font_medium = pixel_font.load("/system/assets/fonts/futile.ppf")
         self.font_large = pixel_font.load("/system/assets/fonts/ignore.ppf")
         self.pet = PetRenderer()
+        self._last_frame_key = None
+        self._last_settings_key = None
+        self._menu_key = None
+        self._menu_items = None
+        self._measure_cache = {}
+        self._fmt_cache = {}
+        self._cx_cache = {}
+        self._last_splash_key = None
         screen.antialias = image.X4
         print("[stockpet] Display initialized, fonts loaded")
 
     def center_x(self, text):
-        w = screen.measure_text(text)[0]
-        return (screen.width - w) // 2
-
-    def dim(self, rgb_tuple, low_battery=False):
-        if low_battery:
-            return tuple(int(c * 0.85) for c in rgb_tuple)
-        return rgb_tuple
-
-    def draw_battery(self, low_battery=False):
-        if is_charging():
-            battery_level = (io.ticks / 20) % 100
-        else:
-            battery_level = get_battery_level()
+        # measure_text walks every glyph, and the same labels come through
+        # each frame - the centered x depends only on the active font and
+        # the string, so memoize on that pair
+        k = (id(screen.font), text)
+        x = self._cx_cache.get(k)
+        if x is None:
+            if len(self._cx_cache) > 64:
+                self._cx_cache.clear()
+            x = (screen.width - screen.measure_text(text)[0]) // 2
+            self._cx_cache[k] = x
+        return x
+
+    def draw_battery(self, low_battery=False, charging=False, battery_level=0):
+        if charging:
+            battery_level = (io.ticks // 20) % 100
         pos_x = screen.width - 22
         pos_y = 2
         width = 16
         height = 8
-        if is_charging():
-            bat_color = COLORS["after_hours"]
+        pal = _PAL_DIM if low_battery else _PAL
+        if charging:
+            bat_pen = pal["after_hours"]
         elif battery_level > 50:
-            bat_color = COLORS["up"]
+            bat_pen = pal["up"]
         elif battery_level > 20:
-            bat_color = COLORS["neutral"]
+            bat_pen = pal["neutral"]
         else:
-            bat_color = COLORS["down"]
-        bat_color = self.dim(bat_color, low_battery)
-        screen.pen = rgb(*bat_color)
+            bat_pen = pal["down"]
+        screen.pen = bat_pen
         screen.rectangle(pos_x, pos_y, width, height)
         screen.rectangle(pos_x + width, pos_y + 2, 2, 4)
-        screen.pen = rgb(*COLORS["bg"])
+        screen.pen = _PAL["bg"]
         screen.rectangle(pos_x + 1, pos_y + 1, width - 2, height - 2)
-        fill_width = int((width - 4) * battery_level / 100)
-        screen.pen = rgb(*bat_color)
+        fill_width = ((width - 4) * int(battery_level)) // 100
+        screen.pen = bat_pen
         screen.rectangle(pos_x + 2, pos_y + 2, fill_width, height - 4)
 
     def draw_splash(self, message, progress, total):
-        screen.pen = rgb(*COLORS["bg"])
+        # The startup loop calls this every frame; only repaint when the
+        # message or progress actually moved
+        key = (message, progress, total)
+        if key == self._last_splash_key:
+            return
+        self._last_splash_key = key
+        self._last_frame_key = None
+        self._last_settings_key = None
+        screen.pen = _PAL["bg"]
         screen.clear()
         screen.font = self.font_medium
-        screen.pen = rgb(*COLORS["text"])
+        screen.pen = _PAL["text"]
         title = "StockPet"
         screen.text(title, self.center_x(title), 20)
         screen.font = self.font_small
-        screen.pen = rgb(*COLORS["dim"])
+        screen.pen = _PAL["dim"]
         screen.text(message, self.center_x(message), 55)
         progress_str = f"({progress}/{total})"
         screen.text(progress_str, self.center_x(progress_str), 75)
@@ -872,100 +1441,171 @@ class PetDisplay:
         bar_x = (screen.width - bar_width) // 2
         bar_y = 95
         bar_height = 8
-        screen.pen = rgb(*COLORS["dim"])
+        screen.pen = _PAL["dim"]
         screen.rectangle(bar_x, bar_y, bar_width, bar_height)
-        fill_width = int(bar_width * progress / total) if total > 0 else 0
-        screen.pen = rgb(*COLORS["up"])
+        fill_width = (bar_width * progress) // total if total > 0 else 0
+        screen.pen = _PAL["up"]
         screen.rectangle(bar_x, bar_y, fill_width, bar_height)
 
-    def render_pet(self, ticker, data, market_open, session, holiday,
-                   mood_key, mood_text, mood_index, settings, low_battery=False):
-        current_ms = time.ticks_ms()
-        change = data.get("change", 0)
-        price = data.get("price", 0)
-        change_percent = data.get("change_percent", 0)
-        has_error = data.get("error", False)
+    def _mfmt(self, fn, arg):
+        """Memoized formatter call.
+
+        Frames are milliseconds apart but quotes change seconds apart, so
+        the same strings get rebuilt thousands of times; string formatting
+        is mostly heap churn on MicroPython. Bounded by a dump-and-refill.
+        """
+        k = (fn, arg)
+        v = self._fmt_cache.get(k)
+        if v is None:
+            if len(self._fmt_cache) > 32:
+                self._fmt_cache.clear()
+            v = fn(arg)
+            self._fmt_cache[k] = v
+        return v
+
+    def render_pet(self, ticker, store, idx, market_open, session, holiday,
+                   mood_key, mood_text, mood_index, settings, current_ms,
+                   low_battery=False, charging=False, battery_level=0,
+                   skip_decor=False):
+        change = store.changes[idx]
+        price = store.prices[idx]
+        change_percent = store.pcts[idx]
+        has_error = store.errors[idx]
+        self._last_settings_key = None
+
+        # Frame skip: the flat mood has no time-driven animation, so when
+        # the content matches what is already on screen (and no blink or
+        # scale lerp is in flight) there is nothing to redraw. Battery state
+        # comes in pre-polled on the BATTERY_POLL_MS cadence - reading the
+        # ADC here would put it back on every frame of exactly the idle
+        # states this skip exists for.
+        if mood_key == "flat" and not charging:
+            key = (ticker, int(price * 100), int(change_percent * 1000),
+                   market_open, low_battery, mood_text, mood_index, has_error,
+                   settings.show_battery, battery_level)
+            if (key == self._last_frame_key
+                    and self.pet.is_static(change_percent, market_open, current_ms)):
+                return
+            self._last_frame_key = key
+        else:
+            self._last_frame_key = None
+
+        # Hoisted locals: every scr.x / pal lookup below would otherwise
+        # be a global + attribute dict lookup per draw call
+        scr = screen
+        text = scr.text
+        center_x = self.center_x
+        pal = _PAL_DIM if low_battery else _PAL
 
         # Background
-        if not market_open:
-            bg = self.dim(COLORS["sleep_bg"], low_battery)
-        else:
-            bg = self.dim(COLORS["bg"], low_battery)
-        screen.pen = rgb(*bg)
-        screen.clear()
+        scr.pen = pal["bg" if market_open else "sleep_bg"]
+        scr.clear()
 
         # Top bar: ticker + price
-        screen.font = self.font_small
-        screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
-        screen.text(ticker, 4, 2)
-        price_str = fmt_price(price)
-        pw = screen.measure_text(price_str)[0]
-        screen.text(price_str, screen.width - pw - 24, 2)
+        scr.font = self.font_small
+        scr.pen = pal["text"]
+        text(ticker, 4, 2)
+        price_str = self._mfmt(fmt_price, price)
+        pw = scr.measure_text(price_str)[0]
+        text(price_str, scr.width - pw - 24, 2)
 
         # Change percent
-        pct_str = fmt_percent(change_percent)
+        pct_str = self._mfmt(fmt_percent, change_percent)
         if change > 0:
-            pct_color = COLORS["up"]
+            pct_name = "up"
         elif change < 0:
-            pct_color = COLORS["down"]
+            pct_name = "down"
         else:
-            pct_color = COLORS["neutral"]
-        screen.pen = rgb(*self.dim(pct_color, low_battery))
-        screen.font = self.font_menu
-        screen.text(pct_str, self.center_x(pct_str), 14)
+            pct_name = "neutral"
+        scr.pen = pal[pct_name]
+        scr.font = self.font_menu
+        text(pct_str, center_x(pct_str), 14)
 
         # Battery
-        if settings.get("show_battery", True):
-            self.draw_battery(low_battery)
+        if settings.show_battery:
+            self.draw_battery(low_battery, charging, battery_level)
 
         # The Pet
-        self.pet.draw(change_percent, market_open, mood_key, current_ms, low_battery)
+        self.pet.draw(change_percent, market_open, mood_key, current_ms, low_battery, skip_decor)
 
         # Ground line
-        screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
-        screen.rectangle(20, 88, screen.width - 40, 1)
+        scr.pen = pal["dim"]
+        scr.rectangle(20, 88, scr.width - 40, 1)
 
         # Mood text
-        screen.font = self.font_menu
-        screen.pen = rgb(*self.dim(pct_color if market_open else COLORS["zzz"], low_battery))
-        screen.text(mood_text, self.center_x(mood_text), 94)
+        scr.font = self.font_menu
+        scr.pen = pal[pct_name if market_open else "zzz"]
+        text(mood_text, center_x(mood_text), 94)
 
         # Navigation hint
-        screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
-        nav = f"< {mood_index + 1}/{len(STOCKS)} >"
-        screen.text(nav, self.center_x(nav), 108)
+        scr.pen = pal["dim"]
+        nav = self._mfmt(fmt_nav, mood_index)
+        text(nav, center_x(nav), 108)
 
         if has_error:
-            screen.pen = rgb(*self.dim(COLORS["error"], low_battery))
-            screen.text("! data error", self.center_x("! data error"), 108)
+            scr.pen = pal["error"]
+            text("! data error", center_x("! data error"), 108)
 
     def render_settings(self, wifi_connected, last_update, market_open,
-                        settings, selected_index, low_battery=False):
-        screen.pen = rgb(*self.dim(COLORS["bg"], low_battery))
-        screen.clear()
-        self.draw_battery(low_battery)
-        screen.font = self.font_medium
-        screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
+                        settings, selected_index, now, low_battery=False,
+                        charging=False, battery_level=0):
+        # The menu loop below touches screen/palette five-plus times per
+        # row - bind them once here instead of per iteration
+        self._last_frame_key = None
+        ms_ago = time.ticks_diff(now, last_update)
+        updated_str = self._mfmt(fmt_time_ago, (ms_ago // 1000) * 1000)
+        # The menu only changes on input, data refresh, or the clock/battery
+        # readouts ticking over - skip the whole redraw otherwise. Battery
+        # state is the pre-polled copy from the app's BATTERY_POLL_MS beat,
+        # not a fresh ADC read per frame.
+        if not charging:
+            key = (selected_index, wifi_connected, market_open, low_battery,
+                   updated_str, battery_level, settings.snapshot())
+            if key == self._last_settings_key:
+                return
+            self._last_settings_key = key
+        else:
+            self._last_settings_key = None
+        scr = screen
+        text = scr.text
+        measure = scr.measure_text
+        width = scr.width
+        pal = _PAL_DIM if low_battery else _PAL
+        scr.pen = pal["bg"]
+        scr.clear()
+        self.draw_battery(low_battery, charging, battery_level)
+        scr.font = self.font_medium
+        scr.pen = pal["text"]
         title = "Settings"
-        screen.text(title, self.center_x(title), 2)
-        screen.font = self.font_menu
+        text(title, self.center_x(title), 2)
+        scr.font = self.font_menu
         line_height = 11
-        dim_options = {0: "Never", 5: "5 sec", 20: "20 sec", 40: "40 sec", 60: "60 sec"}
-        dim_value = settings.get("auto_dim", 0)
-        dim_text = dim_options.get(dim_value, "Never")
-        menu_items = [
-            ("WiFi", get_wifi_ssid() if wifi_connected else "Disconnected", False),
-            ("IP", get_ip_address(), False),
-            ("Updated", fmt_time_ago(time.ticks_diff(time.ticks_ms(), last_update)), False),
-            ("Battery", f"{int(get_battery_level())}%" + (" chrg" if is_charging() else ""), False),
-            ("Market", "OPEN" if market_open else "CLOSED", False),
-            ("---", "", False),
-            ("Show Battery", "ON" if settings.get("show_battery", True) else "OFF", True),
-            ("Case Light", "ON" if settings.get("case_light", True) else "OFF", True),
-            ("Auto Dim", dim_text, True),
-            ("Auto Cycle", "ON" if settings.get("auto_cycle", False) else "OFF", True),
-            ("Refresh All", "Press A", True),
-        ]
+        # Rebuilding the menu means formatted-string churn plus wifi/battery
+        # queries; navigation only moves the highlight, so reuse the list
+        # until the content itself changes
+        menu_key = (wifi_connected, market_open, updated_str,
+                    battery_level, charging, settings.snapshot())
+        if menu_key == self._menu_key:
+            menu_items = self._menu_items
+        else:
+            dim_options = {0: "Never", 5: "5 sec", 20: "20 sec", 40: "40 sec", 60: "60 sec"}
+            dim_value = settings.auto_dim
+            dim_text = dim_options.get(dim_value, "Never")
+            menu_items = [
+                ("WiFi", get_wifi_ssid() if wifi_connected else "Disconnected", False),
+                ("IP", get_ip_address(), False),
+                ("Updated", updated_str, False),
+                ("Battery", f"{battery_level}%" + (" chrg" if charging else ""), False),
+                ("Market", "OPEN" if market_open else "CLOSED", False),
+                ("---", "", False),
+                ("Show Battery", "ON" if settings.show_battery else "OFF", True),
+                ("Case Light", "ON" if settings.case_light else "OFF", True),
+                ("Auto Dim", dim_text, True),
+                ("Auto Cycle", "ON" if settings.auto_cycle else "OFF", True),
+                ("Refresh All", "Press A", True),
+            ]
+            self._menu_key = menu_key
+            self._menu_items = menu_items
         menu_top = 20
         menu_bottom = 98
         visible_height = menu_bottom - menu_top
@@ -980,57 +1620,72 @@ class PetDisplay:
             if y_pos > menu_bottom:
                 break
             if label == "---":
-                screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
-                screen.rectangle(8, y_pos + 3, screen.width - 16, 1)
+                scr.pen = pal["dim"]
+                scr.rectangle(8, y_pos + 3, width - 16, 1)
                 y_pos += 8
                 continue
             if i == selected_index:
-                screen.pen = rgb(*self.dim((40, 40, 60), low_battery))
-                screen.rectangle(0, y_pos - 1, screen.width, line_height)
-                screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
-                screen.text(">", 2, y_pos)
+                scr.pen = pal["menu_sel"]
+                scr.rectangle(0, y_pos - 1, width, line_height)
+                scr.pen = pal["text"]
+                text(">", 2, y_pos)
             if is_toggle and i == selected_index:
-                screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
+                scr.pen = pal["text"]
             elif is_toggle:
-                screen.pen = rgb(*self.dim(COLORS["after_hours"], low_battery))
+                scr.pen = pal["after_hours"]
             else:
-                screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
-            screen.text(f"{label}:", 12, y_pos)
+                scr.pen = pal["dim"]
+            text(f"{label}:", 12, y_pos)
             if label == "WiFi":
-                col = COLORS["up"] if wifi_connected else COLORS["down"]
+                col = "up" if wifi_connected else "down"
             elif label == "Market":
-                col = COLORS["up"] if market_open else COLORS["after_hours"]
+                col = "up" if market_open else "after_hours"
             elif label == "Show Battery":
-                col = COLORS["up"] if settings.get("show_battery", True) else COLORS["down"]
+                col = "up" if settings.show_battery else "down"
             elif label == "Case Light":
-                col = COLORS["up"] if settings.get("case_light", True) else COLORS["down"]
+                col = "up" if settings.case_light else "down"
             elif label == "Auto Dim":
-                col = COLORS["neutral"] if settings.get("auto_dim", 0) == 0 else COLORS["after_hours"]
+                col = "neutral" if settings.auto_dim == 0 else "after_hours"
             elif label == "Auto Cycle":
-                col = COLORS["up"] if settings.get("auto_cycle", False) else COLORS["down"]
+                col = "up" if settings.auto_cycle else "down"
             elif label == "Refresh All":
-                col = COLORS["neutral"]
+                col = "neutral"
             else:
-                col = COLORS["text"]
-            screen.pen = rgb(*self.dim(col, low_battery))
-            val_width = screen.measure_text(value)[0]
-            screen.text(value, screen.width - val_width - 6, y_pos)
+                col = "text"
+            scr.pen = pal[col]
+            val_width = self._measure_cache.get(value)
+            if val_width is None:
+                if len(self._measure_cache) > 64:
+                    self._measure_cache.clear()
+                val_width = measure(value)[0]
+                self._measure_cache[value] = val_width
+            text(value, width - val_width - 6, y_pos)
             y_pos += line_height
         if scroll_offset > 0:
-            screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
-            screen.text("^", screen.width // 2 - 3, menu_top - 4)
+            scr.pen = pal["dim"]
+            text("^", width // 2 - 3, menu_top - 4)
         if scroll_offset + max_visible < len(menu_items):
-            screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
-            screen.text("v", screen.width // 2 - 3, menu_bottom + 2)
-        screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
+            scr.pen = pal["dim"]
+            text("v", width // 2 - 3, menu_bottom + 2)
+        scr.pen = pal["dim"]
         footer = "UP/DN:Nav A:Select B:Back"
-        screen.text(footer, self.center_x(footer), 108)
+        text(footer, self.center_x(footer), 108)
 
 
 # =============================================================================
 # App Controller
 # =============================================================================
 
+# Settings-menu neighbor tables: row 5 is the divider, so these encode the
+# skip directly instead of patching up a modulus result on every keypress
+_MENU_NEXT = (1, 2, 3, 4, 6, 6, 7, 8, 9, 10, 0)
+_MENU_PREV = (10, 0, 1, 2, 3, 4, 4, 6, 7, 8, 9)
+
+# Auto-dim cycles through a closed set of timeouts; successor mapping
+# beats a list scan plus modulus per press
+_DIM_NEXT = {0: 5, 5: 20, 20: 40, 40: 60, 60: 0}
+
+
 class StockPetApp:
     CYCLE_INTERVAL_MS = 30_000
 
@@ -1039,122 +1694,149 @@ class StockPetApp:
         self.display = PetDisplay()
         self.mode = AppMode.STARTUP
         self.current_index = 0
+        # Tuple copy + cached length: indexing a tuple attribute skips the
+        # module-dict global lookup the hot paths would otherwise repeat
+        self._stocks = tuple(STOCKS)
+        self._n = len(STOCKS)
+        self._cur_ticker = self._stocks[0]
         self.wifi_connected = False
         self.market_open = False
         self.session = None
         self.holiday = None
-        self.settings = {
-            "show_battery": True,
-            "case_light": True,
-            "auto_dim": 0,
-            "auto_cycle": False,
-        }
-        self.dim_options = [0, 5, 20, 40, 60]
+        self.settings = Settings()
         self.last_activity_ms = time.ticks_ms()
         self.is_dimmed = False
         self.last_cycle_ms = time.ticks_ms()
         self.settings_index = 0
-        self.settings_menu_count = 11
-        self.stock_data = {ticker: get_mock_data(ticker) for ticker in STOCKS}
-        for d in self.stock_data.values():
-            d["last_fetch_ms"] = 0
+        self.store = StockStore(STOCKS)
         self.startup_index = 0
         self.startup_connecting = True
         self.wifi_attempts = 0
         self.wifi_max_attempts = 10
         self.wifi_gave_up = False
+        self._splash_msg = None
+        self._splash_attempt = -1
         self.last_background_check = 0
-        self.background_index = 0
+        self._net_worker_running = False
         self.refreshing = False
+        self._refresh_pending = set()
+        self._refresh_done = []
+        self._refresh_requests = []
+        self._refresh_all_requested = False
+        try:
+            import _thread
+            self._refresh_lock = _thread.allocate_lock()
+        except ImportError:
+            self._refresh_lock = None
         self.mood_text_index = 0
         self.last_mood_change = time.ticks_ms()
+        self._render_avg_ms = 0
+        self._next_housekeep_ms = 0
+        self._led_pattern = None
+        self._battery_due = 0
+        self._bg_queue = []
+        self._low_battery = False
+        self._charging = False
+        self._battery_level = 0
         print("[stockpet] Init complete")
 
     def current_ticker(self):
-        if self.current_index >= len(STOCKS):
-            self.current_index = 0
-        return STOCKS[self.current_index]
-
-    def current_data(self):
-        return self.stock_data.get(self.current_ticker(), get_mock_data(self.current_ticker()))
+        # Cached at the three places current_index changes; this gets read
+        # several times per frame and a plain attribute load beats a bounds
+        # check plus list index each time
+        return self._cur_ticker
 
-    def handle_input(self):
+    def handle_input(self, now):
         if self.mode == AppMode.STARTUP:
             return
-        any_button = (io.BUTTON_UP in io.pressed or io.BUTTON_DOWN in io.pressed or
-                      io.BUTTON_A in io.pressed or io.BUTTON_B in io.pressed or
-                      io.BUTTON_C in io.pressed)
-        if any_button:
-            self.last_activity_ms = time.ticks_ms()
+        if not io.pressed:
+            # Nothing pressed this frame - the overwhelmingly common case
+            return
+        # Snapshot each button once: the branches below used to re-test
+        # membership on io.pressed up to a dozen times per frame
+        pressed = io.pressed
+        btn_up = io.BUTTON_UP in pressed
+        btn_down = io.BUTTON_DOWN in pressed
+        btn_a = io.BUTTON_A in pressed
+        btn_b = io.BUTTON_B in pressed
+        btn_c = io.BUTTON_C in pressed
+        if btn_up or btn_down or btn_a or btn_b or btn_c:
+            self.last_activity_ms = now
+            # Run housekeeping this frame so LEDs and dim state react now
+            self._next_housekeep_ms = now
             if self.is_dimmed:
                 self.is_dimmed = False
                 display.backlight(1.0)
 
         if self.mode == AppMode.INFO:
-            if io.BUTTON_UP in io.pressed:
-                self.settings_index = (self.settings_index - 1) % self.settings_menu_count
-                if self.settings_index == 5:
-                    self.settings_index = 4
-            if io.BUTTON_DOWN in io.pressed:
-                self.settings_index = (self.settings_index + 1) % self.settings_menu_count
-                if self.settings_index == 5:
-                    self.settings_index = 6
-            if io.BUTTON_A in io.pressed:
+            if btn_up:
+                self.settings_index = _MENU_PREV[self.settings_index]
+            if btn_down:
+                self.settings_index = _MENU_NEXT[self.settings_index]
+            if btn_a:
                 if self.settings_index == 6:
-                    self.settings["show_battery"] = not self.settings["show_battery"]
-                    print(f"[stockpet] Show battery: {self.settings['show_battery']}")
+                    self.settings.show_battery = not self.settings.show_battery
+                    print(f"[stockpet] Show battery: {self.settings.show_battery}")
                 elif self.settings_index == 7:
-                    self.settings["case_light"] = not self.settings["case_light"]
-                    print(f"[stockpet] Case light: {self.settings['case_light']}")
+                    self.settings.case_light = not self.settings.case_light
+                    print(f"[stockpet] Case light: {self.settings.case_light}")
                 elif self.settings_index == 8:
-                    current = self.settings.get("auto_dim", 0)
-                    idx = self.dim_options.index(current) if current in self.dim_options else 0
-                    self.settings["auto_dim"] = self.dim_options[(idx + 1) % len(self.dim_options)]
-                    print(f"[stockpet] Auto dim: {self.settings['auto_dim']}")
+                    self.settings.auto_dim = _DIM_NEXT.get(self.settings.auto_dim, 0)
+                    print(f"[stockpet] Auto dim: {self.settings.auto_dim}")
                 elif self.settings_index == 9:
-                    self.settings["auto_cycle"] = not self.settings["auto_cycle"]
-                    self.last_cycle_ms = time.ticks_ms()
-                    print(f"[stockpet] Auto cycle: {self.settings['auto_cycle']}")
+                    self.settings.auto_cycle = not self.settings.auto_cycle
+                    self.last_cycle_ms = now
+                    print(f"[stockpet] Auto cycle: {self.settings.auto_cycle}")
                 elif self.settings_index == 10:
                     print("[stockpet] Force refresh all")
                     self.force_refresh_all()
-            if io.BUTTON_B in io.pressed:
+            if btn_b:
                 self.mode = AppMode.NORMAL
                 print("[stockpet] Back to pet view")
             return
 
-        if io.BUTTON_UP in io.pressed:
-            self.current_index = (self.current_index - 1) % len(STOCKS)
-            self.last_cycle_ms = time.ticks_ms()
+        if btn_up:
+            self.current_index = (self.current_index - 1) % self._n
+            self._cur_ticker = self._stocks[self.current_index]
+            self.last_cycle_ms = now
             self.mood_text_index = 0
             print(f"[stockpet] Switched to {self.current_ticker()}")
-        if io.BUTTON_DOWN in io.pressed:
-            self.current_index = (self.current_index + 1) % len(STOCKS)
-            self.last_cycle_ms = time.ticks_ms()
+        if btn_down:
+            self.current_index = (self.current_index + 1) % self._n
+            self._cur_ticker = self._stocks[self.current_index]
+            self.last_cycle_ms = now
             self.mood_text_index = 0
             print(f"[stockpet] Switched to {self.current_ticker()}")
-        if io.BUTTON_B in io.pressed:
+        if btn_b:
             self.settings_index = 6
             self.mode = AppMode.INFO
             print("[stockpet] Entering settings")
-        if io.BUTTON_C in io.pressed:
+        if btn_c:
+            # Revalidate in the background rather than stalling the frame
+            # on a blocking fetch; the old quote stays up until it lands
             print(f"[stockpet] Force refresh {self.current_ticker()}")
-            result = fetch_stock_data(self.current_ticker())
-            if result:
-                self.stock_data[self.current_ticker()] = result
+            self._revalidate(self.current_ticker())
 
     def force_refresh_all(self):
-        for ticker in STOCKS:
-            result = fetch_stock_data(ticker)
+        # One pipelined batch on the net worker; results fold in through
+        # _apply_refreshes so the menu stays responsive while it runs
+        # (falls back to an inline batch when the worker couldn't start)
+        if self._net_worker_running:
+            for ticker in self._stocks:
+                self._refresh_pending.add(ticker)
+            self._refresh_all_requested = True
+            return
+        for ticker, result in fetch_all_stocks(list(self._stocks)).items():
+            idx = self._stocks.index(ticker)
             if result:
-                self.stock_data[ticker] = result
+                self.store.set_quote(idx, result)
             else:
-                self.stock_data[ticker]["error"] = True
+                self.store.set_error(idx)
 
     def do_startup(self):
         if self.startup_connecting:
             if self.wifi_gave_up:
-                self.display.draw_splash("WiFi failed!  A:Retry  B:Offline", 0, len(STOCKS))
+                self.display.draw_splash("WiFi failed!  A:Retry  B:Offline", 0, self._n)
                 if io.BUTTON_A in io.pressed:
                     self.wifi_attempts = 0
                     self.wifi_gave_up = False
@@ -1175,85 +1857,235 @@ class StockPetApp:
                     self.wifi_gave_up = True
                     print("[stockpet] WiFi gave up")
                 else:
-                    self.display.draw_splash(
-                        f"Connecting WiFi... ({self.wifi_attempts}/{self.wifi_max_attempts})",
-                        0, len(STOCKS))
+                    # Rebuild the f-string only when the attempt count moves
+                    if self._splash_attempt != self.wifi_attempts:
+                        self._splash_attempt = self.wifi_attempts
+                        self._splash_msg = (f"Connecting WiFi... "
+                                            f"({self.wifi_attempts}/{self.wifi_max_attempts})")
+                    self.display.draw_splash(self._splash_msg, 0, self._n)
                 return
-        if self.startup_index < len(STOCKS):
-            ticker = STOCKS[self.startup_index]
-            self.display.draw_splash(f"Fetching {ticker}...", self.startup_index, len(STOCKS))
+        if self.startup_index < self._n:
+            ticker = self._stocks[self.startup_index]
+            self.display.draw_splash(f"Fetching {ticker}...", self.startup_index, self._n)
             result = fetch_stock_data(ticker)
             if result:
-                self.stock_data[ticker] = result
+                self.store.set_quote(self.startup_index, result)
             else:
-                self.stock_data[ticker]["error"] = True
+                self.store.set_error(self.startup_index)
             self.startup_index += 1
         else:
             self.mode = AppMode.NORMAL
+            self.start_net_worker()
             print("[stockpet] Startup complete, entering pet view")
 
-    def maybe_refresh_current(self):
+    def maybe_refresh_current(self, now):
         ticker = self.current_ticker()
-        data = self.current_data()
-        if is_data_fresh(data, self.market_open):
+        idx = self.current_index
+        if is_data_fresh(self.store, idx, now):
             return
-        if is_data_stale(data, self.market_open):
+        if self.store.last_fetch[idx] == 0:
+            # Nothing cached yet - the only case worth blocking the UI for
             self.refreshing = True
             result = fetch_stock_data(ticker)
             if result:
-                self.stock_data[ticker] = result
+                self.store.set_quote(idx, result)
             else:
-                self.stock_data[ticker]["error"] = True
+                self.store.set_error(idx)
             self.refreshing = False
+            return
+        # Stale-while-revalidate: keep serving the old quote and refresh behind it
+        self._revalidate(ticker)
+
+    def _revalidate(self, ticker):
+        """Queue a background refresh for ticker if one isn't already pending.
+
+        The rp2 port runs at most one thread on core1 and the net worker
+        owns it for the app's lifetime, so a second start_new_thread here
+        could never succeed on the device. Manual refreshes instead go on
+        a queue the worker drains on its next 500 ms beat; without a
+        worker the fetch runs inline.
+        """
+        if ticker in self._refresh_pending:
+            return
+        self._refresh_pending.add(ticker)
+        if self._net_worker_running:
+            if self._refresh_lock:
+                self._refresh_lock.acquire()
+            try:
+                self._refresh_requests.append(ticker)
+            finally:
+                if self._refresh_lock:
+                    self._refresh_lock.release()
+            return
+        result = fetch_stock_data(ticker)
+        idx = self._stocks.index(ticker)
+        if result:
+            self.store.set_quote(idx, result)
+        else:
+            self.store.set_error(idx)
+        self._refresh_pending.discard(ticker)
+
+    def _drain_refresh_requests(self):
+        """Run queued manual refreshes as one pipelined batch (worker thread)."""
+        if self._refresh_all_requested:
+            self._refresh_all_requested = False
+            if self._refresh_lock:
+                self._refresh_lock.acquire()
+            try:
+                self._refresh_requests = []
+            finally:
+                if self._refresh_lock:
+                    self._refresh_lock.release()
+            tickers = list(self._stocks)
+        else:
+            if not self._refresh_requests:
+                return
+            if self._refresh_lock:
+                self._refresh_lock.acquire()
+            try:
+                tickers = self._refresh_requests
+                self._refresh_requests = []
+            finally:
+                if self._refresh_lock:
+                    self._refresh_lock.release()
+        results = fetch_all_stocks(tickers)
+        if self._refresh_lock:
+            self._refresh_lock.acquire()
+        try:
+            for ticker in tickers:
+                self._refresh_done.append((ticker, results.get(ticker)))
+        finally:
+            if self._refresh_lock:
+                self._refresh_lock.release()
+
+    def _apply_refreshes(self):
+        """Fold finished background refreshes into the store (main loop only)."""
+        if not self._refresh_done:
+            return
+        if self._refresh_lock:
+            self._refresh_lock.acquire()
+        try:
+            done = self._refresh_done
+            self._refresh_done = []
+        finally:
+            if self._refresh_lock:
+                self._refresh_lock.release()
+        for ticker, result in done:
+            self._refresh_pending.discard(ticker)
+            idx = self._stocks.index(ticker)
+            if result:
+                self.store.set_quote(idx, result)
+            else:
+                self.store.set_error(idx)
 
-    def maybe_background_fetch(self):
-        now = time.ticks_ms()
-        if time.ticks_diff(now, self.last_background_check) < BACKGROUND_CHECK_MS:
+    def _refresh_stale(self, now):
+        current = self.current_index
+        stale = [self._stocks[i] for i in range(self.store.n)
+                 if i != current and is_data_stale(self.store, i, self.market_open, now)]
+        if not stale:
+            return
+        for ticker, result in fetch_all_stocks(stale).items():
+            idx = self._stocks.index(ticker)
+            if result:
+                self.store.set_quote(idx, result)
+            else:
+                self.store.set_error(idx)
+
+    def maybe_background_fetch(self, now):
+        """Inline stale refresh - only used when the net worker couldn't start.
+
+        One blocking fetch per beat, drawn from a queue of stale tickers,
+        instead of refreshing the whole list in a single burst that stalls
+        input and rendering for several round trips. The queue is rebuilt
+        lazily (one scan) only once it runs dry; while entries remain they
+        drain on a short spacing so a full sweep still finishes promptly.
+        """
+        wait = 5000 if self._bg_queue else BACKGROUND_CHECK_MS
+        if time.ticks_diff(now, self.last_background_check) < wait:
             return
         self.last_background_check = now
-        current = self.current_ticker()
-        for i in range(len(STOCKS)):
-            idx = (self.background_index + i) % len(STOCKS)
-            ticker = STOCKS[idx]
-            if ticker == current:
-                continue
-            data = self.stock_data.get(ticker)
-            if is_data_stale(data, self.market_open):
-                result = fetch_stock_data(ticker)
-                if result:
-                    self.stock_data[ticker] = result
-                else:
-                    self.stock_data[ticker]["error"] = True
-                self.background_index = (idx + 1) % len(STOCKS)
-                break
+        if not self._bg_queue:
+            current = self.current_index
+            self._bg_queue = [self._stocks[i] for i in range(self.store.n)
+                              if i != current and is_data_stale(self.store, i, self.market_open, now)]
+            if not self._bg_queue:
+                return
+        ticker = self._bg_queue.pop(0)
+        idx = self._stocks.index(ticker)
+        result = fetch_stock_data(ticker)
+        if result:
+            self.store.set_quote(idx, result)
+        else:
+            self.store.set_error(idx)
+
+    def start_net_worker(self):
+        """Move the periodic network work onto the second core.
+
+        WiFi hiccups can stall a fetch for seconds; running the market
+        status poll and stale-quote refreshes in their own thread keeps
+        the render tick at full rate regardless of network health. Store
+        writes are single array-slot stores, so the main loop can read
+        them without taking a lock.
+        """
+        if self._net_worker_running:
+            return
+        try:
+            import _thread
+            self._net_worker_running = True
+            _thread.start_new_thread(self._net_worker, ())
+            print("[stockpet] Net worker started")
+        except (ImportError, OSError):
+            self._net_worker_running = False
+            print("[stockpet] No net worker, fetching inline")
+
+    def _net_worker(self):
+        beat = 0
+        while self._net_worker_running:
+            try:
+                if beat <= 0:
+                    self.market_open, self.session, self.holiday = fetch_market_status()
+                    self._refresh_stale(time.ticks_ms())
+                    beat = BACKGROUND_CHECK_MS // 500
+                self._drain_refresh_requests()
+            except Exception as e:
+                print(f"[stockpet] Net worker error: {e}")
+                beat = BACKGROUND_CHECK_MS // 500
+            beat -= 1
+            time.sleep_ms(500)
+
+    def stop_net_worker(self):
+        self._net_worker_running = False
 
     def update_case_light(self):
-        if not self.settings.get("case_light", True):
-            for led in range(4):
-                set_case_led(led, 0)
-            return
-        change = self.current_data().get("change", 0)
-        if not self.market_open:
-            set_case_led(0, 0); set_case_led(1, 0)
-            set_case_led(2, 1); set_case_led(3, 1)
-        elif change > 0:
-            for led in range(4):
-                set_case_led(led, 1)
-        elif change < 0:
-            set_case_led(0, 1); set_case_led(1, 1)
-            set_case_led(2, 0); set_case_led(3, 0)
+        # Resolve the target state to a 4-bit mask (LED 0 = bit 0) and only
+        # touch the hardware when the mask actually changes - the common
+        # case is four redundant GPIO writes for an unchanged pattern
+        if not self.settings.case_light:
+            pattern = 0b0000
+        elif not self.market_open:
+            pattern = 0b1100
         else:
-            set_case_led(0, 1); set_case_led(1, 0)
-            set_case_led(2, 1); set_case_led(3, 0)
+            change = self.store.changes[self.current_index]
+            if change > 0:
+                pattern = 0b1111
+            elif change < 0:
+                pattern = 0b0011
+            else:
+                pattern = 0b0101
+        if pattern == self._led_pattern:
+            return
+        self._led_pattern = pattern
+        for led in range(4):
+            set_case_led(led, (pattern >> led) & 1)
 
-    def update_auto_dim(self):
-        dim_seconds = self.settings.get("auto_dim", 0)
+    def update_auto_dim(self, now):
+        dim_seconds = self.settings.auto_dim
         if dim_seconds == 0:
             if self.is_dimmed:
                 self.is_dimmed = False
                 display.backlight(1.0)
             return
-        idle_ms = time.ticks_diff(time.ticks_ms(), self.last_activity_ms)
+        idle_ms = time.ticks_diff(now, self.last_activity_ms)
         idle_seconds = idle_ms // 1000
         if idle_seconds >= dim_seconds and not self.is_dimmed:
             self.is_dimmed = True
@@ -1264,54 +2096,78 @@ class StockPetApp:
             display.backlight(1.0)
             print("[stockpet] Display woken")
 
-    def update_auto_cycle(self):
-        if not self.settings.get("auto_cycle", False):
+    def update_auto_cycle(self, now):
+        if not self.settings.auto_cycle:
             return
-        now = time.ticks_ms()
         if time.ticks_diff(now, self.last_cycle_ms) < self.CYCLE_INTERVAL_MS:
             return
         self.last_cycle_ms = now
-        self.current_index = (self.current_index + 1) % len(STOCKS)
+        self.current_index = (self.current_index + 1) % self._n
+        self._cur_ticker = self._stocks[self.current_index]
         self.mood_text_index = 0
         print(f"[stockpet] Auto-cycled to {self.current_ticker()}")
 
-    def update_mood_text(self):
-        now = time.ticks_ms()
+    def update_mood_text(self, now):
         if time.ticks_diff(now, self.last_mood_change) >= MOOD_CHANGE_MS:
             self.mood_text_index += 1
             self.last_mood_change = now
 
     def update(self):
-        wifi.tick()
-        self.handle_input()
-        self.market_open, self.session, self.holiday = fetch_market_status()
-        self.wifi_connected = wifi.is_connected()
-        low_battery = not is_charging() and get_battery_level() < 20
+        # One ticks_ms read per tick, threaded through everything below -
+        # each call is a native trampoline we don't need to repeat
+        now = time.ticks_ms()
+        self.handle_input(now)
         if self.mode == AppMode.STARTUP:
             self.do_startup()
             return
-        self.update_auto_dim()
+        # All the periodic work below runs at second-or-slower scale; each
+        # routine used to be called every frame just to bounce off its own
+        # ticks_diff check. One shared deadline skips the lot between beats
+        # (handle_input pulls it forward so input still reacts this frame).
+        if time.ticks_diff(now, self._next_housekeep_ms) >= 0:
+            self._next_housekeep_ms = now + HOUSEKEEP_MS
+            wifi.tick()
+            self.wifi_connected = wifi.is_connected()
+            if not self._net_worker_running:
+                self.market_open, self.session, self.holiday = fetch_market_status(now)
+            if time.ticks_diff(now, self._battery_due) >= 0:
+                self._battery_due = now + BATTERY_POLL_MS
+                self._charging = is_charging()
+                self._battery_level = int(get_battery_level())
+                self._low_battery = not self._charging and self._battery_level < 20
+            self.update_auto_dim(now)
+            if self.mode == AppMode.NORMAL:
+                self.update_auto_cycle(now)
+                self.update_mood_text(now)
+                self.maybe_refresh_current(now)
+                if not self._net_worker_running:
+                    self.maybe_background_fetch(now)
+            self.update_case_light()
+        low_battery = self._low_battery
+        # Fold in finished background fetches in both views, so a
+        # menu-triggered refresh-all lands while the menu is still open
+        self._apply_refreshes()
         if self.mode == AppMode.INFO:
-            latest = max((d.get("last_fetch_ms", 0) for d in self.stock_data.values()), default=0)
             self.display.render_settings(
-                self.wifi_connected, latest, self.market_open,
-                self.settings, self.settings_index, low_battery)
-            self.update_case_light()
+                self.wifi_connected, self.store.latest_fetch, self.market_open,
+                self.settings, self.settings_index, now, low_battery,
+                self._charging, self._battery_level)
             return
-        self.update_auto_cycle()
-        self.update_mood_text()
-        self.maybe_refresh_current()
-        self.maybe_background_fetch()
-        data = self.current_data()
-        change_percent = data.get("change_percent", 0)
+        change_percent = self.store.pcts[self.current_index]
         mood_key = get_mood_key(change_percent, self.market_open)
         mood_text = pick_mood_text(mood_key, self.mood_text_index)
+        render_start = time.ticks_ms()
         self.display.render_pet(
-            self.current_ticker(), data, self.market_open,
+            self.current_ticker(), self.store, self.current_index, self.market_open,
             self.session, self.holiday,
             mood_key, mood_text, self.current_index,
-            self.settings, low_battery)
-        self.update_case_light()
+            self.settings, render_start, low_battery,
+            self._charging, self._battery_level,
+            skip_decor=self._render_avg_ms > FRAME_BUDGET_MS)
+        # Rolling average of render cost; while it sits over budget the
+        # renderer sheds its decorative particles rather than slowing down
+        elapsed = time.ticks_diff(time.ticks_ms(), render_start)
+        self._render_avg_ms = (self._render_avg_ms * 4 + elapsed) // 5
 
 
 # =============================================================================
@@ -1328,6 +2184,8 @@ def update():
     _app.update()
 
 def on_exit():
+    if _app:
+        _app.stop_net_worker()
     for led in range(4):
         set_case_led(led, 0)
     display.backlight(1.0)
@@ -10,11 +10,12 @@ import wifi
 import secrets
 import json
 import math
+from array import array
 
 os.chdir(APP_DIR)
 sys.path.insert(0, APP_DIR)
 
-from badgeware import run, get_battery_level, is_charging, set_case_led, get_case_led, display
+from badgeware import run, get_battery_level, is_charging, set_case_led, get_case_led, display, State
 from easing import easeOutSine
 
 try:
@@ -46,6 +47,7 @@ COLORS = {
     "error": (255, 100, 100),
     "ludicrous": (255, 240, 100),   # bright yellow-white streaks
     "drift": (80, 80, 180),         # slow wavy blue-purple
+    "select": (40, 40, 60),
 }
 
 MARKET_OPEN_HOUR = 9.5
@@ -116,22 +118,20 @@ class TickerSize:
 # Formatting
 # =============================================================================
 
-def _fmt_decimal(val, decimals=2):
-    rounded = round(val, decimals)
-    s = str(rounded)
-    if "." not in s:
-        return s + "." + "0" * decimals
-    integer, frac = s.split(".")
-    while len(frac) < decimals:
-        frac += "0"
-    return integer + "." + frac
+def _fmt_decimal(val):
+    # Scale to cents and format as integers: one f-string instead of the
+    # round/str/split/pad dance, which costs several allocations per call.
+    n = int(val * 100 + (0.5 if val >= 0 else -0.5))
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    return f"{sign}{n // 100}.{n % 100:02d}"
 
 def fmt_price(val):
-    return "$" + _fmt_decimal(val, 2)
+    return "$" + _fmt_decimal(val)
 
 def fmt_change(val):
     prefix = "+" if val >= 0 else ""
-    return prefix + _fmt_decimal(val, 2)
+    return prefix + _fmt_decimal(val)
 
 def fmt_percent(val):
     return fmt_change(val) + "%"
@@ -205,35 +205,98 @@ def fetch_market_status():
 # Helpers
 # =============================================================================
 
-def get_wifi_ssid():
+# SSID/IP hit the network driver, so refresh them on a short TTL rather
+# than per frame while the settings screen is open.
+_wifi_info_cache = {"ssid": "Unknown", "ip": "N/A", "last_fetch": None}
+WIFI_INFO_TTL_MS = 2_000
+
+def _refresh_wifi_info():
+    now = time.ticks_ms()
+    last = _wifi_info_cache["last_fetch"]
+    if last is not None and now - last < WIFI_INFO_TTL_MS:
+        return
+    _wifi_info_cache["last_fetch"] = now
     try:
-        return getattr(secrets, "WIFI_SSID", "Connected") if wifi.is_connected() else "Not connected"
+        connected = wifi.is_connected()
+        _wifi_info_cache["ssid"] = getattr(secrets, "WIFI_SSID", "Connected") if connected else "Not connected"
+        _wifi_info_cache["ip"] = (wifi.ipv4() or "N/A") if connected else "N/A"
     except Exception:
-        return "Unknown"
+        _wifi_info_cache["ssid"] = "Unknown"
+        _wifi_info_cache["ip"] = "N/A"
+
+def get_wifi_ssid():
+    _refresh_wifi_info()
+    return _wifi_info_cache["ssid"]
 
 def get_ip_address():
-    try:
-        import network
-        wlan = network.WLAN(network.STA_IF)
-        return wlan.ifconfig()[0] if wlan.isconnected() else "N/A"
-    except Exception:
-        return "N/A"
+    _refresh_wifi_info()
+    return _wifi_info_cache["ip"]
 
 
 # =============================================================================
 # Animation
 # =============================================================================
 
+# 256-step pulse table: one easeOutSine evaluation per entry at import,
+# then get_pulse_alpha is a modulo and an array index. 256 steps over a 2 s
+# period is well below the badge panel's banding threshold.
+_PULSE_LUT = array("f", (0.5 + easeOutSine(i / 256) * 0.5 for i in range(256)))
+
+# Full-wave sine scaled to the drift's +/-12 px amplitude. Indexing this
+# replaces the soft-float math.sin call in draw_ludicrous; the only trig
+# left at runtime happens here at import.
+_SIN_LUT = array("h", (int(12 * math.sin(i * 2 * math.pi / 256)) for i in range(256)))
+# Alpha quantized to 32 levels: indistinguishable over a 2 s pulse, and it
+# means consecutive frames usually share an index, which lets the frame-key
+# dedupe in render_stock skip the repaint entirely.
+_PULSE_ALPHA_IDX = array("B", (int(_PULSE_LUT[i] * 31) for i in range(256)))
+
 def get_pulse_alpha(current_ms, period=ANIMATION_PERIOD_MS):
-    phase = (current_ms % period) / period
-    return 0.5 + easeOutSine(phase) * 0.5
+    return _PULSE_LUT[(current_ms % period) * 256 // period & 255]
 
-def blend_color(base_rgb, alpha):
-    return tuple(int(c * alpha) for c in base_rgb)
+def pulse_alpha_index(current_ms, period=ANIMATION_PERIOD_MS):
+    return _PULSE_ALPHA_IDX[(current_ms % period) * 256 // period & 255]
 
 def rgb(r, g, b):
     return color.rgb(r, g, b)
 
+# Pens are immutable, so build one per named color at import instead of
+# re-invoking color.rgb() on constant tuples every frame. The _DIM variants
+# bake in the 0.85 low-battery factor that dim() used to apply per call.
+PENS = {name: rgb(*c) for name, c in COLORS.items()}
+PENS_DIM = {name: rgb(int(c[0] * 0.85), int(c[1] * 0.85), int(c[2] * 0.85)) for name, c in COLORS.items()}
+
+# Every pulse-blended color pre-multiplied against the 32 quantized alpha
+# levels, so the hot path picks a ready pen by index instead of building a
+# tuple and calling rgb(). Low battery folds in by scaling the index —
+# blending is linear in alpha, so idx * 217 // 256 is the same 0.85 dim.
+_BLEND_BASES = {
+    "bg_up": (30, 60, 30),
+    "bg_down": (60, 30, 30),
+    "bg_flat": (40, 40, 40),
+    "text": COLORS["text"],
+}
+_BLEND_PENS = {
+    name: [rgb(r * a // 31, g * a // 31, b * a // 31) for a in range(32)]
+    for name, (r, g, b) in _BLEND_BASES.items()
+}
+
+# Style tables keyed by change sign and market session — one dict lookup
+# per frame in place of the old if/elif ladders. Values hold ready
+# (normal, dimmed) pen pairs indexed by the low_battery bool, so the hot
+# path never goes back through the name->pen dicts.
+def _pen_pair(name):
+    return (PENS[name], PENS_DIM[name])
+
+_CHANGE_PENS = {1: _pen_pair("up"), -1: _pen_pair("down"), 0: _pen_pair("neutral")}
+_BG_BLEND = {1: "bg_up", -1: "bg_down", 0: "bg_flat"}
+_STATUS_STYLES = {
+    "pre-market": ("Pre-Market", _pen_pair("neutral")),
+    "post-market": ("After Hours", _pen_pair("after_hours")),
+    "open": ("Market OPEN", _pen_pair("up")),
+    "closed": ("Market CLOSED", _pen_pair("after_hours")),
+}
+
 
 # =============================================================================
 # Data Fetching
@@ -264,23 +327,37 @@ def fetch_stock_data(ticker):
         return None
 
 
-def get_data_age(stock_data):
+def get_data_age(stock_data, now_ms):
     if stock_data is None:
         return 999999999
-    return time.ticks_ms() - stock_data.get("last_fetch_ms", 0)
+    return now_ms - stock_data.get("last_fetch_ms", 0)
 
-def is_data_fresh(stock_data, market_open):
-    return get_data_age(stock_data) < FRESH_MS
+def is_data_fresh(stock_data, market_open, now_ms):
+    return get_data_age(stock_data, now_ms) < FRESH_MS
 
-def is_data_stale(stock_data, market_open):
+def is_data_stale(stock_data, market_open, now_ms):
     threshold = STALE_MS if market_open else MARKET_CLOSED_STALE_MS
-    return get_data_age(stock_data) > threshold
+    return get_data_age(stock_data, now_ms) > threshold
 
 
 # =============================================================================
 # Display
 # =============================================================================
 
+@micropython.viper
+def _warp_offsets(phase: int, span: int, out: ptr32):
+    """Streak x-offsets for the ludicrous warp, one per diagonal.
+
+    The per-streak modulo arithmetic is trivial but runs 28 times a frame
+    at full warp speed; viper compiles it to native integer code so the
+    Python loop only issues the line draws.
+    """
+    i = 0
+    while i < 28:
+        out[i] = (i * 14 + phase) % span - 40
+        i += 1
+
+
 class StockDisplay:
     def __init__(self):
         self.font_small = pixel_font.load("/system/assets/fonts/fear.ppf")
@@ -289,83 +366,194 @@ class StockDisplay:
         self.font_large = pixel_font.load("/system/assets/fonts/ignore.ppf")
         screen.antialias = image.X4
 
+        # Glyph measurement walks the PPF metrics, so cache widths per
+        # (font, text) and warm the strings that never change. Price and
+        # change strings churn, hence the size bound.
+        self._measure_cache = {}
+        self._last_frame_key = None
+        self._fmt_key = None
+        self._price_str = ""
+        self._change_str = ""
+        self._menu_key = None
+        self._ago_bucket = None
+        self._ago_str = ""
+        self._clock_bucket = None
+        self._clock_str = ""
+        self._text_sprites = {}
+        self._last_pen = None
+        self._warp_buf = array("l", (0 for _ in range(28)))
+        self._bat_key = None
+        self._bat_pen = None
+        self._bat_fill = 0
+
+        # Settings rows as mutable [label, value, is_toggle] lists reused
+        # across repaints; render_settings rewrites the value slots in place
+        self._menu_items = [
+            ["WiFi", "", False],
+            ["IP", "", False],
+            ["Updated", "", False],
+            ["Battery", "", False],
+            ["Market", "", False],
+            ["---", "", False],
+            ["Show Battery", "", True],
+            ["Case Light", "", True],
+            ["Auto Dim", "", True],
+            ["Auto Cycle", "", True],
+            ["Ludicrous Mode", "", True],
+            ["Refresh All", "Press A", True],
+        ]
+
+        # Per-TickerSize layout rows: (ticker_font, ticker_y, price_font,
+        # price_y, change_y, status_y); None means the element is not drawn
+        # at that size. Change and status always use the small font.
+        self._layouts = (
+            (self.font_medium, 10, self.font_medium, 40, 70, 95),   # LARGE
+            (self.font_large, 8, self.font_medium, 45, 75, 95),     # LARGER
+            (self.font_large, 10, self.font_large, 50, 90, None),   # EVEN_LARGER
+            (self.font_large, 30, self.font_medium, 75, None, None),  # GARGANTUAN
+        )
+        for font, texts in (
+            (self.font_small, ("Market OPEN", "Market CLOSED", "Pre-Market",
+                               "After Hours", "refreshing...", "! retry soon")),
+            (self.font_medium, (*STOCKS, "STONKS", "Settings")),
+            (self.font_large, tuple(STOCKS)),
+            (self.font_menu, ("UP/DN:Nav A:Select B:Back",)),
+        ):
+            screen.font = font
+            for text in texts:
+                self.text_width(text)
+
+    def text_width(self, text):
+        key = (id(screen.font), text)
+        w = self._measure_cache.get(key)
+        if w is None:
+            if len(self._measure_cache) > 64:
+                self._measure_cache.clear()
+            w = screen.measure_text(text)[0]
+            self._measure_cache[key] = w
+        return w
+
     def center_x(self, text):
-        w = screen.measure_text(text)[0]
-        return (screen.width - w) // 2
+        return (screen.width - self.text_width(text)) // 2
 
-    def dim(self, rgb_tuple, low_battery=False):
-        if low_battery:
-            return tuple(int(c * 0.85) for c in rgb_tuple)
-        return rgb_tuple
+    def _text_sprite(self, text, pen):
+        """Pre-rendered label for this font/text/pen combo.
+
+        Ticker symbols and status strings are constant, but text() pushes
+        every glyph through the PPF pipeline on each call — so rasterize the
+        label once into a small offscreen image and blit it after that.
+        Blits blend with per-pixel alpha, so labels composite over the
+        pulsing background.
+        """
+        key = (id(screen.font), text, id(pen))
+        sprite = self._text_sprites.get(key)
+        if sprite is None:
+            if len(self._text_sprites) >= 16:
+                self._text_sprites.clear()
+            w, h = screen.measure_text(text)
+            sprite = image(int(w) + 1, int(h) + 1)
+            sprite.font = screen.font
+            sprite.pen = pen
+            sprite.text(text, 0, 0)
+            self._text_sprites[key] = sprite
+        return sprite
+
+    def blit_label(self, text, pen, y):
+        screen.blit(self._text_sprite(text, pen), vec2(self.center_x(text), y))
+
+    def pen(self, name, low_battery=False):
+        return PENS_DIM[name] if low_battery else PENS[name]
+
+    def _set_pen(self, p):
+        # Assigning screen.pen crosses into the C binding; the settings menu
+        # sets the same dim/accent pens dozens of times per repaint, so skip
+        # the write when the pen hasn't changed.
+        if p is not self._last_pen:
+            self._last_pen = p
+            screen.pen = p
 
     def draw_battery(self, low_battery=False):
-        if is_charging():
-            battery_level = (io.ticks / 20) % 100
+        charging = is_charging()
+        if charging:
+            battery_level = (io.ticks // 20) % 100
         else:
-            battery_level = get_battery_level()
+            battery_level = int(get_battery_level())
 
         pos_x = screen.width - 22
         pos_y = 4
         width = 16
         height = 8
 
-        if is_charging():
-            bat_color = COLORS["after_hours"]
-        elif battery_level > 50:
-            bat_color = COLORS["up"]
-        elif battery_level > 20:
-            bat_color = COLORS["neutral"]
-        else:
-            bat_color = COLORS["down"]
-
-        bat_color = self.dim(bat_color, low_battery)
+        # The level only matters at 10% resolution in a 12 px gauge, so
+        # recompute the pen and fill width when the bucket moves, not per call
+        key = (battery_level // 10, charging, low_battery)
+        if key != self._bat_key:
+            self._bat_key = key
+            if charging:
+                bat_name = "after_hours"
+            elif battery_level > 50:
+                bat_name = "up"
+            elif battery_level > 20:
+                bat_name = "neutral"
+            else:
+                bat_name = "down"
+            self._bat_pen = self.pen(bat_name, low_battery)
+            self._bat_fill = ((width - 4) * battery_level) // 100
 
-        screen.pen = rgb(*bat_color)
+        screen.pen = self._bat_pen
         screen.rectangle(pos_x, pos_y, width, height)
         screen.rectangle(pos_x + width, pos_y + 2, 2, 4)
 
-        screen.pen = rgb(*COLORS["bg"])
+        screen.pen = PENS["bg"]
         screen.rectangle(pos_x + 1, pos_y + 1, width - 2, height - 2)
 
-        fill_width = int((width - 4) * battery_level / 100)
-        screen.pen = rgb(*bat_color)
-        screen.rectangle(pos_x + 2, pos_y + 2, fill_width, height - 4)
+        screen.pen = self._bat_pen
+        screen.rectangle(pos_x + 2, pos_y + 2, self._bat_fill, height - 4)
 
-    def draw_ludicrous(self, current_ms, change, low_battery=False):
+    def draw_ludicrous(self, current_ms, sign, low_battery=False):
         """Spaceballs-style background: fast plaid warp when up, slow wavy drift when down."""
-        if change == 0:
+        if sign == 0:
             return
 
-        if change > 0:
+        if sign > 0:
             # LUDICROUS SPEED – fast crossing diagonal streaks
             phase = (current_ms // 6) % (screen.width * 2)
-            col = self.dim(COLORS["ludicrous"], low_battery)
-            screen.pen = rgb(*col)
+            screen.pen = self.pen("ludicrous", low_battery)
+            buf = self._warp_buf
+            _warp_offsets(phase, screen.width + 80, buf)
+            line = screen.line
+            h = screen.height
             for i in range(28):
-                offset = (i * 14 + phase) % (screen.width + 80) - 40
-                screen.line(offset, 0, offset + 35, screen.height)
-                screen.line(offset + 12, 0, offset - 18, screen.height)  # plaid cross
+                offset = buf[i]
+                line(offset, 0, offset + 35, h)
+                line(offset + 12, 0, offset - 18, h)  # plaid cross
         else:
             # Slow disorienting drift
             phase = (current_ms // 55) % 360
-            col = self.dim(COLORS["drift"], low_battery)
-            screen.pen = rgb(*col)
+            screen.pen = self.pen("drift", low_battery)
+            rectangle = screen.rectangle
+            height = screen.height
+            width = screen.width
+            shift = (phase * 7) // 10
             for i in range(18):
-                y = (i * 14 + int(phase * 0.7)) % screen.height
-                wave = int(12 * math.sin((y + phase) * 0.04))
-                screen.rectangle(wave, y, screen.width - wave * 2, 4)
+                y = (i * 14 + shift) % height
+                # (y + phase) * 0.04 rad ~= index (y + phase) * 417 >> 8
+                wave = _SIN_LUT[((y + phase) * 417 >> 8) & 0xFF]
+                rectangle(wave, y, width - wave * 2, 4)
 
     def draw_splash(self, message, progress, total):
-        screen.pen = rgb(*COLORS["bg"])
+        self._last_frame_key = None
+        self._menu_key = None
+        screen.pen = PENS["bg"]
         screen.clear()
 
         screen.font = self.font_medium
-        screen.pen = rgb(*COLORS["text"])
+        screen.pen = PENS["text"]
         title = "STONKS"
         screen.text(title, self.center_x(title), 20)
 
         screen.font = self.font_small
-        screen.pen = rgb(*COLORS["dim"])
+        screen.pen = PENS["dim"]
         screen.text(message, self.center_x(message), 55)
 
         progress_str = f"({progress}/{total})"
@@ -376,140 +564,160 @@ class StockDisplay:
         bar_y = 95
         bar_height = 8
 
-        screen.pen = rgb(*COLORS["dim"])
+        screen.pen = PENS["dim"]
         screen.rectangle(bar_x, bar_y, bar_width, bar_height)
 
-        fill_width = int(bar_width * progress / total) if total > 0 else 0
-        screen.pen = rgb(*COLORS["up"])
+        fill_width = (bar_width * progress) // total if total > 0 else 0
+        screen.pen = PENS["up"]
         screen.rectangle(bar_x, bar_y, fill_width, bar_height)
 
-    def render_stock(self, ticker, data, market_open, session, holiday, ticker_size, refreshing=False, settings=None, low_battery=False):
+    def render_stock(self, ticker, data, market_open, session, holiday, ticker_size, refreshing=False, settings=None, low_battery=False, now_ms=None):
         if settings is None:
             settings = {}
 
-        current_ms = time.ticks_ms()
-        change = data.get("change", 0)
-        price = data.get("price", 0)
-        change_percent = data.get("change_percent", 0)
+        current_ms = time.ticks_ms() if now_ms is None else now_ms
+        change = data["change"]
+        price = data["price"]
+        change_percent = data["change_percent"]
         has_error = data.get("error", False)
+        sign = (change > 0) - (change < 0)
+
+        alpha_idx = pulse_alpha_index(current_ms)
+        if low_battery:
+            alpha_idx = alpha_idx * 217 // 256
+
+        # The framebuffer persists between frames, so if nothing visible
+        # changed — same quote, same pulse step, same battery reading — skip
+        # the clear and redraw entirely. Everything that feeds a pixel is in
+        # the key; the ludicrous phase is bucketed so warp frames still dedupe.
+        ludicrous = settings.get("ludicrous", False) and market_open
+        if is_charging():
+            bat_key = int((io.ticks // 20) % 100) // 10
+        else:
+            bat_key = int(get_battery_level()) // 10
+        frame_key = (
+            ticker, price, change, change_percent, has_error,
+            market_open, session, holiday, ticker_size, refreshing,
+            settings.get("show_battery", True), low_battery, alpha_idx,
+            bat_key, current_ms // 50 if ludicrous and sign else -1,
+        )
+        if frame_key == self._last_frame_key:
+            return
+        self._last_frame_key = frame_key
+        self._menu_key = None
 
         # Background
         if not market_open:
-            base_bg = COLORS["bg"]
+            screen.pen = self.pen("bg", low_battery)
         else:
-            alpha = get_pulse_alpha(current_ms)
-            if change > 0:
-                base = (30, 60, 30)
-            elif change < 0:
-                base = (60, 30, 30)
-            else:
-                base = (40, 40, 40)
-            base_bg = blend_color(base, alpha)
-        bg = self.dim(base_bg, low_battery)
-        screen.pen = rgb(*bg)
+            screen.pen = _BLEND_PENS[_BG_BLEND[sign]][alpha_idx]
         screen.clear()
 
         # Ludicrous mode behind everything
-        if settings.get("ludicrous", False) and market_open:
-            self.draw_ludicrous(current_ms, change, low_battery)
+        if ludicrous:
+            self.draw_ludicrous(current_ms, sign, low_battery)
 
         if settings.get("show_battery", True):
             self.draw_battery(low_battery)
 
         # Price color
-        price_base = COLORS["text"] if market_open else blend_color(COLORS["text"], get_pulse_alpha(current_ms))
-        price_color = self.dim(price_base, low_battery)
-
-        price_str = fmt_price(price)
-
-        # Short change string
-        change_str = f"{fmt_change(change)} ({fmt_percent(change_percent)})"
-        if change > 0:
-            change_color = self.dim(COLORS["up"], low_battery)
-        elif change < 0:
-            change_color = self.dim(COLORS["down"], low_battery)
+        if market_open:
+            price_pen = self.pen("text", low_battery)
         else:
-            change_color = self.dim(COLORS["neutral"], low_battery)
+            price_pen = _BLEND_PENS["text"][alpha_idx]
+
+        # Formatting only changes when the quote does, not per frame
+        fmt_key = (price, change, change_percent)
+        if fmt_key != self._fmt_key:
+            self._fmt_key = fmt_key
+            self._price_str = fmt_price(price)
+            self._change_str = f"{fmt_change(change)} ({fmt_percent(change_percent)})"
+        price_str = self._price_str
+        change_str = self._change_str
+        change_pen = _CHANGE_PENS[sign][low_battery]
 
         # Market status
         if holiday:
             status_text = holiday
-            status_color = self.dim(COLORS["after_hours"], low_battery)
-        elif session == "pre-market":
-            status_text = "Pre-Market"
-            status_color = self.dim(COLORS["neutral"], low_battery)
-        elif session == "post-market":
-            status_text = "After Hours"
-            status_color = self.dim(COLORS["after_hours"], low_battery)
-        elif market_open:
-            status_text = "Market OPEN"
-            status_color = self.dim(COLORS["up"], low_battery)
+            status_pen = _STATUS_STYLES["closed"][1][low_battery]
         else:
-            status_text = "Market CLOSED"
-            status_color = self.dim(COLORS["after_hours"], low_battery)
+            style = _STATUS_STYLES.get(session)
+            if style is None:
+                style = _STATUS_STYLES["open" if market_open else "closed"]
+            status_text = style[0]
+            status_pen = style[1][low_battery]
 
         # Layouts
-        if ticker_size == TickerSize.LARGE:
-            screen.font = self.font_medium
-            screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
-            screen.text(ticker, self.center_x(ticker), 10)
-            screen.pen = rgb(*price_color)
-            screen.text(price_str, self.center_x(price_str), 40)
-            screen.font = self.font_small
-            screen.pen = rgb(*change_color)
-            screen.text(change_str, self.center_x(change_str), 70)
-            screen.pen = rgb(*status_color)
-            screen.text(status_text, self.center_x(status_text), 95)
-
-        elif ticker_size == TickerSize.LARGER:
-            screen.font = self.font_large
-            screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
-            screen.text(ticker, self.center_x(ticker), 8)
-            screen.font = self.font_medium
-            screen.pen = rgb(*price_color)
-            screen.text(price_str, self.center_x(price_str), 45)
+        ticker_pen = self.pen("text", low_battery)
+        ticker_font, ticker_y, price_font, price_y, change_y, status_y = self._layouts[ticker_size]
+
+        screen.font = ticker_font
+        self.blit_label(ticker, ticker_pen, ticker_y)
+        if price_font is not ticker_font:
+            screen.font = price_font
+        screen.pen = price_pen
+        screen.text(price_str, self.center_x(price_str), price_y)
+        if change_y is not None:
             screen.font = self.font_small
-            screen.pen = rgb(*change_color)
-            screen.text(change_str, self.center_x(change_str), 75)
-            screen.pen = rgb(*status_color)
-            screen.text(status_text, self.center_x(status_text), 95)
-
-        elif ticker_size == TickerSize.EVEN_LARGER:
-            screen.font = self.font_large
-            screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
-            screen.text(ticker, self.center_x(ticker), 10)
-            screen.pen = rgb(*price_color)
-            screen.text(price_str, self.center_x(price_str), 50)
-            screen.font = self.font_small
-            screen.pen = rgb(*change_color)
-            screen.text(change_str, self.center_x(change_str), 90)
-
-        else:  # GARGANTUAN
-            screen.font = self.font_large
-            screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
-            screen.text(ticker, self.center_x(ticker), 30)
-            screen.font = self.font_medium
-            screen.pen = rgb(*price_color)
-            screen.text(price_str, self.center_x(price_str), 75)   # bumped up
-
-        if refreshing:
-            screen.font = self.font_small
-            screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
-            screen.text("refreshing...", self.center_x("refreshing..."), 110)
-
-        if has_error:
-            screen.font = self.font_small
-            screen.pen = rgb(*self.dim(COLORS["error"], low_battery))
-            screen.text("! retry soon", self.center_x("! retry soon"), 110)
+            screen.pen = change_pen
+            screen.text(change_str, self.center_x(change_str), change_y)
+        if status_y is not None:
+            self.blit_label(status_text, status_pen, status_y)
+
+        if refreshing or has_error:
+            # Every layout with a change line already left the small font set
+            if change_y is None:
+                screen.font = self.font_small
+            if refreshing:
+                self.blit_label("refreshing...", self.pen("dim", low_battery), 110)
+            if has_error:
+                self.blit_label("! retry soon", self.pen("error", low_battery), 110)
+
+    def render_settings(self, wifi_connected, last_update, market_open, settings, selected_index, low_battery=False, now_ms=None):
+        self._last_frame_key = None
+        if now_ms is None:
+            now_ms = time.ticks_ms()
+
+        # Everything on this screen changes on the order of seconds (the
+        # "Updated" line and clock) or on input, so hash the inputs and skip
+        # the rebuild when nothing moved.
+        ago_bucket = (now_ms - last_update) // 1000
+        if ago_bucket != self._ago_bucket:
+            self._ago_bucket = ago_bucket
+            self._ago_str = fmt_time_ago(ago_bucket * 1000)
+        updated_str = self._ago_str
+
+        # localtime() is an RTC read; refresh the clock string every few
+        # seconds instead of every frame
+        clock_bucket = now_ms // 5000
+        if clock_bucket != self._clock_bucket:
+            self._clock_bucket = clock_bucket
+            now = time.localtime()
+            self._clock_str = f"{now[3]:02d}:{now[4]:02d}"
+        clock_str = self._clock_str
+        if is_charging():
+            bat_key = int((io.ticks // 20) % 100)
+        else:
+            bat_key = int(get_battery_level())
+        menu_key = (
+            wifi_connected, get_wifi_ssid(), get_ip_address(), updated_str,
+            bat_key, market_open, selected_index, low_battery, clock_str,
+            settings.get("show_battery", True), settings.get("case_light", True),
+            settings.get("auto_dim", 0), settings.get("auto_cycle", False),
+            settings.get("ludicrous", False),
+        )
+        if menu_key == self._menu_key:
+            return
+        self._menu_key = menu_key
+        self._last_pen = None
 
-    def render_settings(self, wifi_connected, last_update, market_open, settings, selected_index, low_battery=False):
-        screen.pen = rgb(*self.dim(COLORS["bg"], low_battery))
+        self._set_pen(self.pen("bg", low_battery))
         screen.clear()
 
         self.draw_battery(low_battery)
 
         screen.font = self.font_medium
-        screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
+        self._set_pen(self.pen("text", low_battery))
         title = "Settings"
         screen.text(title, self.center_x(title), 2)
 
@@ -521,20 +729,17 @@ class StockDisplay:
         dim_value = settings.get("auto_dim", 0)
         dim_text = dim_options.get(dim_value, "Never")
 
-        menu_items = [
-            ("WiFi", get_wifi_ssid() if wifi_connected else "Disconnected", False),
-            ("IP", get_ip_address(), False),
-            ("Updated", fmt_time_ago(time.ticks_ms() - last_update), False),
-            ("Battery", f"{int(get_battery_level())}%" + (" chrg" if is_charging() else ""), False),
-            ("Market", "OPEN" if market_open else "CLOSED", False),
-            ("---", "", False),
-            ("Show Battery", "ON" if settings.get("show_battery", True) else "OFF", True),
-            ("Case Light", "ON" if settings.get("case_light", True) else "OFF", True),
-            ("Auto Dim", dim_text, True),
-            ("Auto Cycle", "ON" if settings.get("auto_cycle", False) else "OFF", True),
-            ("Ludicrous Mode", "ON" if settings.get("ludicrous", False) else "OFF", True),
-            ("Refresh All", "Press A", True),
-        ]
+        menu_items = self._menu_items
+        menu_items[0][1] = get_wifi_ssid() if wifi_connected else "Disconnected"
+        menu_items[1][1] = get_ip_address()
+        menu_items[2][1] = updated_str
+        menu_items[3][1] = f"{int(get_battery_level())}%" + (" chrg" if is_charging() else "")
+        menu_items[4][1] = "OPEN" if market_open else "CLOSED"
+        menu_items[6][1] = "ON" if settings.get("show_battery", True) else "OFF"
+        menu_items[7][1] = "ON" if settings.get("case_light", True) else "OFF"
+        menu_items[8][1] = dim_text
+        menu_items[9][1] = "ON" if settings.get("auto_cycle", False) else "OFF"
+        menu_items[10][1] = "ON" if settings.get("ludicrous", False) else "OFF"
 
         menu_top = 20
         menu_bottom = 98
@@ -553,67 +758,65 @@ class StockDisplay:
                 break
 
             if label == "---":
-                screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
+                self._set_pen(self.pen("dim", low_battery))
                 screen.rectangle(8, y_pos + 3, screen.width - 16, 1)
                 y_pos += 8
                 continue
 
             if i == selected_index:
-                screen.pen = rgb(*self.dim((40, 40, 60), low_battery))
+                self._set_pen(self.pen("select", low_battery))
                 screen.rectangle(0, y_pos - 1, screen.width, line_height)
-                screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
+                self._set_pen(self.pen("text", low_battery))
                 screen.text(">", 2, y_pos)
 
             if is_toggle and i == selected_index:
-                screen.pen = rgb(*self.dim(COLORS["text"], low_battery))
+                self._set_pen(self.pen("text", low_battery))
             elif is_toggle:
-                screen.pen = rgb(*self.dim(COLORS["after_hours"], low_battery))
+                self._set_pen(self.pen("after_hours", low_battery))
             else:
-                screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
+                self._set_pen(self.pen("dim", low_battery))
 
             screen.text(f"{label}:", 12, y_pos)
 
             if label == "WiFi":
-                col = COLORS["up"] if wifi_connected else COLORS["down"]
+                col = "up" if wifi_connected else "down"
             elif label == "Market":
-                col = COLORS["up"] if market_open else COLORS["after_hours"]
+                col = "up" if market_open else "after_hours"
             elif label == "Show Battery":
-                col = COLORS["up"] if settings.get("show_battery", True) else COLORS["down"]
+                col = "up" if settings.get("show_battery", True) else "down"
             elif label == "Case Light":
-                col = COLORS["up"] if settings.get("case_light", True) else COLORS["down"]
+                col = "up" if settings.get("case_light", True) else "down"
             elif label == "Auto Dim":
-                col = COLORS["neutral"] if settings.get("auto_dim", 0) == 0 else COLORS["after_hours"]
+                col = "neutral" if settings.get("auto_dim", 0) == 0 else "after_hours"
             elif label == "Auto Cycle":
-                col = COLORS["up"] if settings.get("auto_cycle", False) else COLORS["down"]
+                col = "up" if settings.get("auto_cycle", False) else "down"
             elif label == "Ludicrous Mode":
-                col = COLORS["up"] if settings.get("ludicrous", False) else COLORS["down"]
+                col = "up" if settings.get("ludicrous", False) else "down"
             elif label == "Refresh All":
-                col = COLORS["neutral"]
+                col = "neutral"
             else:
-                col = COLORS["text"]
-            screen.pen = rgb(*self.dim(col, low_battery))
+                col = "text"
+            self._set_pen(self.pen(col, low_battery))
 
-            val_width = screen.measure_text(value)[0]
+            val_width = self.text_width(value)
             screen.text(value, screen.width - val_width - 6, y_pos)
 
             y_pos += line_height
 
         if scroll_offset > 0:
-            screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
+            self._set_pen(self.pen("dim", low_battery))
             screen.text("^", screen.width // 2 - 3, menu_top - 4)
         if scroll_offset + max_visible < len(menu_items):
-            screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
+            self._set_pen(self.pen("dim", low_battery))
             screen.text("v", screen.width // 2 - 3, menu_bottom + 2)
 
-        screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
+        self._set_pen(self.pen("dim", low_battery))
         footer = "UP/DN:Nav A:Select B:Back"
         screen.text(footer, self.center_x(footer), 110)
 
         screen.font = self.font_small
-        screen.pen = rgb(*self.dim(COLORS["dim"], low_battery))
-        now = time.localtime()
-        clock_str = f"{now[3]:02d}:{now[4]:02d}"
-        clock_w = screen.measure_text(clock_str)[0]
+        self._set_pen(self.pen("dim", low_battery))
+        clock_w = self.text_width(clock_str)
         screen.text(clock_str, screen.width - clock_w - 8, 110)
 
 
@@ -639,6 +842,18 @@ class StocksApp:
             "auto_cycle": False,         # Carousel mode - cycle through tickers
             "ludicrous": False,          # default OFF – it's fun but optional
         }
+
+        # Restore persisted settings/navigation. Saves are debounced through
+        # a dirty flag — flash writes stall the UI, so button presses only
+        # mark state dirty and update() coalesces them (at most one write
+        # every 2 s, plus a final flush in on_exit).
+        state = {"settings": {}, "index": 0, "size": TickerSize.LARGE}
+        State.load("stocks", state)
+        self.settings.update(state["settings"])
+        self.current_index = state["index"] % len(STOCKS)
+        self.ticker_size = state["size"] % TickerSize._COUNT
+        self._state_dirty = False
+        self._last_state_save = 0
         
         # Auto dim options cycle: Never -> 5 -> 20 -> 40 -> 60 -> Never
         self.dim_options = [0, 5, 20, 40, 60]
@@ -658,46 +873,76 @@ class StocksApp:
         for d in self.stock_data.values():
             d["last_fetch_ms"] = 0
 
+        # Parallel index-keyed views: the per-frame accessors below index a
+        # tuple/list instead of hashing ticker strings into stock_data.
+        self._tickers = tuple(STOCKS)
+        self._stock_list = [self.stock_data[t] for t in self._tickers]
+        self.latest_fetch_ms = 0
+
         self.startup_index = 0
         self.startup_connecting = True
 
         self.last_background_check = 0
         self.background_index = 0
         self.refreshing = False
+        self.last_market_poll = None
+        self.last_wifi_poll = None
 
     def current_ticker(self):
-        if self.current_index >= len(STOCKS):
+        if self.current_index >= len(self._tickers):
             self.current_index = 0
-        return STOCKS[self.current_index]
+        return self._tickers[self.current_index]
 
     def current_data(self):
-        return self.stock_data.get(self.current_ticker(), get_mock_data(self.current_ticker()))
+        return self._stock_list[self.current_index]
+
+    def _apply_result(self, idx, result):
+        # Update the existing dict rather than swapping it out: the slot
+        # objects stay shared between stock_data and _stock_list, and each
+        # refresh stops retiring a five-key dict to the GC
+        d = self._stock_list[idx]
+        if result:
+            d.update(result)
+            d["error"] = False
+            self.latest_fetch_ms = d["last_fetch_ms"]
+        else:
+            d["error"] = True
 
-    def handle_input(self):
+    def handle_input(self, now):
         if self.mode == AppMode.STARTUP:
             return
 
+        # Snapshot the pressed set once; the branches below used to redo
+        # the membership tests per check
+        pressed = io.pressed
+        if not pressed:
+            return
+        btn_up = io.BUTTON_UP in pressed
+        btn_down = io.BUTTON_DOWN in pressed
+        btn_a = io.BUTTON_A in pressed
+        btn_b = io.BUTTON_B in pressed
+
         # Track activity for auto-dim (any button press resets timer)
-        any_button = (io.BUTTON_UP in io.pressed or io.BUTTON_DOWN in io.pressed or 
-                      io.BUTTON_A in io.pressed or io.BUTTON_B in io.pressed)
-        if any_button:
-            self.last_activity_ms = time.ticks_ms()
+        if btn_up or btn_down or btn_a or btn_b:
+            self.last_activity_ms = now
             # Wake up display if dimmed
             if self.is_dimmed:
                 self.is_dimmed = False
                 display.backlight(1.0)
 
         if self.mode == AppMode.INFO:
-            if io.BUTTON_UP in io.pressed:
+            if btn_up:
                 self.settings_index = (self.settings_index - 1) % self.settings_menu_count
                 if self.settings_index == 5:
                     self.settings_index = 4
-            if io.BUTTON_DOWN in io.pressed:
+            if btn_down:
                 self.settings_index = (self.settings_index + 1) % self.settings_menu_count
                 if self.settings_index == 5:
                     self.settings_index = 6
 
-            if io.BUTTON_A in io.pressed:
+            if btn_a:
+                if 6 <= self.settings_index <= 10:
+                    self._state_dirty = True
                 if self.settings_index == 6:
                     self.settings["show_battery"] = not self.settings["show_battery"]
                 elif self.settings_index == 7:
@@ -708,35 +953,46 @@ class StocksApp:
                     self.settings["auto_dim"] = self.dim_options[(idx + 1) % len(self.dim_options)]
                 elif self.settings_index == 9:          # Auto Cycle
                     self.settings["auto_cycle"] = not self.settings["auto_cycle"]
-                    self.last_cycle_ms = time.ticks_ms()  # Reset cycle timer
+                    self.last_cycle_ms = now  # Reset cycle timer
                 elif self.settings_index == 10:         # Ludicrous Mode
                     self.settings["ludicrous"] = not self.settings["ludicrous"]
                 elif self.settings_index == 11:
                     self.force_refresh_all()
 
-            if io.BUTTON_B in io.pressed:
+            if btn_b:
                 self.mode = AppMode.NORMAL
             return
 
-        if io.BUTTON_UP in io.pressed:
+        if btn_up:
             self.current_index = (self.current_index - 1) % len(STOCKS)
-            self.last_cycle_ms = time.ticks_ms()  # Reset cycle timer on manual nav
-        if io.BUTTON_DOWN in io.pressed:
+            self.last_cycle_ms = now  # Reset cycle timer on manual nav
+            self._state_dirty = True
+        if btn_down:
             self.current_index = (self.current_index + 1) % len(STOCKS)
-            self.last_cycle_ms = time.ticks_ms()  # Reset cycle timer on manual nav
-        if io.BUTTON_A in io.pressed:
+            self.last_cycle_ms = now  # Reset cycle timer on manual nav
+            self._state_dirty = True
+        if btn_a:
             self.ticker_size = (self.ticker_size + 1) % TickerSize._COUNT
-        if io.BUTTON_B in io.pressed:
+            self._state_dirty = True
+        if btn_b:
             self.settings_index = 6
             self.mode = AppMode.INFO
 
+    def save_state(self):
+        State.save("stocks", {
+            "settings": self.settings,
+            "index": self.current_index,
+            "size": self.ticker_size,
+        })
+        self._state_dirty = False
+
+    def flush_state(self):
+        if self._state_dirty:
+            self.save_state()
+
     def force_refresh_all(self):
-        for ticker in STOCKS:
-            result = fetch_stock_data(ticker)
-            if result:
-                self.stock_data[ticker] = result
-            else:
-                self.stock_data[ticker]["error"] = True
+        for idx, ticker in enumerate(self._tickers):
+            self._apply_result(idx, fetch_stock_data(ticker))
 
     def do_startup(self):
         if self.startup_connecting:
@@ -748,52 +1004,37 @@ class StocksApp:
                 self.display.draw_splash("Connecting WiFi...", 0, len(STOCKS))
                 return
 
-        if self.startup_index < len(STOCKS):
-            ticker = STOCKS[self.startup_index]
-            self.display.draw_splash(f"Fetching {ticker}...", self.startup_index, len(STOCKS))
-            result = fetch_stock_data(ticker)
-            if result:
-                self.stock_data[ticker] = result
-            else:
-                self.stock_data[ticker]["error"] = True
+        if self.startup_index < len(self._tickers):
+            ticker = self._tickers[self.startup_index]
+            self.display.draw_splash(f"Fetching {ticker}...", self.startup_index, len(self._tickers))
+            self._apply_result(self.startup_index, fetch_stock_data(ticker))
             self.startup_index += 1
         else:
             self.mode = AppMode.NORMAL
 
-    def maybe_refresh_current(self):
+    def maybe_refresh_current(self, now):
         ticker = self.current_ticker()
         data = self.current_data()
-        if is_data_fresh(data, self.market_open):
+        if is_data_fresh(data, self.market_open, now):
             return
-        if is_data_stale(data, self.market_open):
+        if is_data_stale(data, self.market_open, now):
             self.refreshing = True
-            result = fetch_stock_data(ticker)
-            if result:
-                self.stock_data[ticker] = result
-            else:
-                self.stock_data[ticker]["error"] = True
+            self._apply_result(self.current_index, fetch_stock_data(ticker))
             self.refreshing = False
 
-    def maybe_background_fetch(self):
-        now = time.ticks_ms()
+    def maybe_background_fetch(self, now):
         if now - self.last_background_check < BACKGROUND_CHECK_MS:
             return
         self.last_background_check = now
 
-        current = self.current_ticker()
-        for i in range(len(STOCKS)):
-            idx = (self.background_index + i) % len(STOCKS)
-            ticker = STOCKS[idx]
-            if ticker == current:
+        n = len(self._tickers)
+        for i in range(n):
+            idx = (self.background_index + i) % n
+            if idx == self.current_index:
                 continue
-            data = self.stock_data.get(ticker)
-            if is_data_stale(data, self.market_open):
-                result = fetch_stock_data(ticker)
-                if result:
-                    self.stock_data[ticker] = result
-                else:
-                    self.stock_data[ticker]["error"] = True
-                self.background_index = (idx + 1) % len(STOCKS)
+            if is_data_stale(self._stock_list[idx], self.market_open, now):
+                self._apply_result(idx, fetch_stock_data(self._tickers[idx]))
+                self.background_index = (idx + 1) % n
                 break
 
     def update_case_light(self):
@@ -831,7 +1072,7 @@ class StocksApp:
             set_case_led(2, 1)  # BOTTOM_RIGHT
             set_case_led(3, 0)  # BOTTOM_LEFT
 
-    def update_auto_dim(self):
+    def update_auto_dim(self, now):
         """Handle auto-dimming of display backlight."""
         dim_seconds = self.settings.get("auto_dim", 0)
         
@@ -843,7 +1084,7 @@ class StocksApp:
             return
         
         # Check if enough time has passed since last activity
-        idle_ms = time.ticks_ms() - self.last_activity_ms
+        idle_ms = now - self.last_activity_ms
         idle_seconds = idle_ms // 1000
         
         if idle_seconds >= dim_seconds and not self.is_dimmed:
@@ -855,7 +1096,7 @@ class StocksApp:
             self.is_dimmed = False
             display.backlight(1.0)
 
-    def update_auto_cycle(self):
+    def update_auto_cycle(self, now):
         """Handle automatic cycling through tickers (carousel mode).
         
         Simple round-robin - cycles through all tickers in order.
@@ -863,7 +1104,6 @@ class StocksApp:
         if not self.settings.get("auto_cycle", False):
             return
         
-        now = time.ticks_ms()
         if now - self.last_cycle_ms < self.CYCLE_INTERVAL_MS:
             return
         
@@ -872,11 +1112,26 @@ class StocksApp:
         self.current_index = (self.current_index + 1) % len(STOCKS)
 
     def update(self):
-        wifi.tick()
-        self.handle_input()
+        # One timestamp per frame: every sub-step below takes now as an
+        # argument so the pulse and timers can't tear mid-frame.
+        now = time.ticks_ms()
+        self.handle_input(now)
+
+        # fetch_market_status caches internally, but even the cached call is
+        # dict traffic we don't need per frame — poll on the cache interval.
+        # wifi.tick/is_connected go to the driver, so poll those on a short
+        # TTL too; do_startup still ticks every frame while connecting.
+        if self.last_market_poll is None or now - self.last_market_poll >= MARKET_CACHE_MS:
+            self.last_market_poll = now
+            self.market_open, self.session, self.holiday = fetch_market_status()
+        if self.last_wifi_poll is None or now - self.last_wifi_poll >= WIFI_INFO_TTL_MS:
+            self.last_wifi_poll = now
+            wifi.tick()
+            self.wifi_connected = wifi.is_connected()
 
-        self.market_open, self.session, self.holiday = fetch_market_status()
-        self.wifi_connected = wifi.is_connected()
+        if self._state_dirty and now - self._last_state_save >= 2000:
+            self._last_state_save = now
+            self.save_state()
 
         low_battery = not is_charging() and get_battery_level() < 20
 
@@ -885,27 +1140,26 @@ class StocksApp:
             return
 
         # Handle auto-dim
-        self.update_auto_dim()
+        self.update_auto_dim(now)
 
         if self.mode == AppMode.INFO:
-            latest = max((d.get("last_fetch_ms", 0) for d in self.stock_data.values()), default=0)
             self.display.render_settings(
-                self.wifi_connected, latest, self.market_open,
-                self.settings, self.settings_index, low_battery
+                self.wifi_connected, self.latest_fetch_ms, self.market_open,
+                self.settings, self.settings_index, low_battery, now
             )
             self.update_case_light()
             return
 
         # Handle auto-cycle (carousel mode)
-        self.update_auto_cycle()
+        self.update_auto_cycle(now)
 
-        self.maybe_refresh_current()
-        self.maybe_background_fetch()
+        self.maybe_refresh_current(now)
+        self.maybe_background_fetch(now)
 
         self.display.render_stock(
             self.current_ticker(), self.current_data(), self.market_open,
             self.session, self.holiday, self.ticker_size, self.refreshing,
-            self.settings, low_battery
+            self.settings, low_battery, now
         )
         self.update_case_light()
 
@@ -924,6 +1178,8 @@ def update():
     _app.update()
 
 def on_exit():
+    if _app:
+        _app.flush_state()
     # Turn off case LEDs when exiting
     for led in range(4):
         set_case_led(led, 0)